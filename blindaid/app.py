@@ -1,32 +1,48 @@
 """CLI entry point."""
-import argparse
+import functools
 import logging
+import os
 import signal
 import sys
+from types import SimpleNamespace
 from typing import Sequence, Optional
 
 from blindaid.core import config
 
 logger = logging.getLogger(__name__)
 
+_LOG_FORMATTER = logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+
 
 def setup_logging(debug: bool = False) -> None:
     level = logging.DEBUG if debug else logging.INFO
-    logging.basicConfig(level=level, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    root = logging.getLogger()
+    root.setLevel(level)
+    if root.handlers:
+        return
+    # Records never print thread/process fields, so skip looking them up
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    handler = logging.StreamHandler()
+    handler.setFormatter(_LOG_FORMATTER)
+    root.addHandler(handler)
 
 
 def signal_handler(signum, _frame):
+    """Exit immediately instead of unwinding through the capture loop.
+
+    The OS reclaims the camera and audio devices on process exit; orderly
+    teardown for normal exits is handled by ModeController.shutdown().
+    """
     logger.info("Received signal %s, shutting down", signum)
-    sys.exit(0)
+    logging.shutdown()
+    os._exit(0)
 
 
-def parse_arguments(argv: Optional[Sequence[str]] = None):
-    parser = argparse.ArgumentParser(
-        description="BlindAid - Assistive Technology System",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+_EPILOG = """
 Examples:
-    # Start in scene mode (default)
+    # Start in sitting mode (default)
     python -m blindaid
 
     # Start in reading mode
@@ -34,14 +50,30 @@ Examples:
 
     # Use a different camera with audio disabled
     python -m blindaid --camera 1 --no-audio
-        """
+
+    # Force full-precision models
+    python -m blindaid --precision fp32
+
+    # Render the fixed spoken phrases to audio clips once, then exit
+    python -m blindaid --prerender-tts
+"""
+
+
+@functools.lru_cache(maxsize=None)
+def _build_parser():
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="BlindAid - Assistive Technology System",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG,
     )
 
     parser.add_argument(
         "--start-mode",
         type=str,
         default="sitting",
-        choices=["sitting", "guardian", "reading", "people"],
+        choices=config.MODE_KEYS,
         help="Mode to start in (default: sitting)",
     )
     parser.add_argument(
@@ -56,9 +88,80 @@ Examples:
         action="store_false",
         help="Disable audio feedback",
     )
+    parser.add_argument(
+        "--precision",
+        type=str,
+        default=config.MODEL_PRECISION,
+        choices=config.PRECISION_CHOICES,
+        help=f"Model inference precision (default: {config.MODEL_PRECISION})",
+    )
+    parser.add_argument(
+        "--prerender-tts",
+        action="store_true",
+        help="Render the fixed spoken phrases to audio clips and exit",
+    )
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
 
-    return parser.parse_args(argv)
+    return parser
+
+
+def _fast_parse(argv: Sequence[str]) -> Optional[SimpleNamespace]:
+    """Parse the usual flags without importing argparse.
+
+    Returns None for anything it does not fully understand (--help,
+    abbreviations, bad values) so argparse can handle it and report errors.
+    """
+    args = SimpleNamespace(
+        start_mode="sitting",
+        camera=config.DEFAULT_CAMERA_INDEX,
+        audio=True,
+        precision=config.MODEL_PRECISION,
+        prerender_tts=False,
+        debug=False,
+    )
+    tokens = list(argv)
+    while tokens:
+        option, inline, value = tokens.pop(0).partition("=")
+        if option in ("--no-audio", "--debug"):
+            if inline:
+                return None
+            if option == "--no-audio":
+                args.audio = False
+            else:
+                args.debug = True
+            continue
+        if option not in ("--start-mode", "--camera", "--precision"):
+            return None
+        if not inline:
+            if not tokens:
+                return None
+            value = tokens.pop(0)
+        # argparse decides what empty or padded values mean
+        if not value or value != value.strip():
+            return None
+        if option == "--start-mode":
+            if value not in config.MODE_KEYS:
+                return None
+            args.start_mode = value
+        elif option == "--precision":
+            if value not in config.PRECISION_CHOICES:
+                return None
+            args.precision = value
+        else:
+            try:
+                args.camera = int(value)
+            except ValueError:
+                return None
+    return args
+
+
+def parse_arguments(argv: Optional[Sequence[str]] = None):
+    if argv is None:
+        argv = sys.argv[1:]
+    args = _fast_parse(argv)
+    if args is None:
+        args = _build_parser().parse_args(argv)
+    return args
 
 
 def main():
@@ -67,6 +170,16 @@ def main():
     signal.signal(signal.SIGINT, signal_handler)
     if hasattr(signal, "SIGTERM"):
         signal.signal(signal.SIGTERM, signal_handler)
+    if args.prerender_tts:
+        from blindaid.core.audio import prerender_clips
+
+        try:
+            count = prerender_clips(config.TTS_PRERENDER_PHRASES)
+        except Exception:  # noqa: BLE001
+            logger.exception("Could not render TTS clips")
+            return 1
+        logger.info("Rendered %d TTS clips into %s", count, config.TTS_CLIPS_DIR)
+        return 0
     logger.info("Starting BlindAid (mode=%s, camera=%s)", args.start_mode, args.camera)
     try:
         from blindaid.controller import ModeController
@@ -75,6 +188,7 @@ def main():
             camera_index=args.camera,
             audio_enabled=args.audio,
             initial_mode=args.start_mode,
+            precision=args.precision,
         )
         controller.run()
     except Exception:  # noqa: BLE001
@@ -1,12 +1,19 @@
 """Main controller - handles mode switching and input."""
 from __future__ import annotations
 
+import atexit
+import heapq
+import importlib
+import itertools
 import logging
+import os
+import sys
 import threading
 import time
+from collections import OrderedDict
 from collections.abc import Callable, Sequence
 from dataclasses import dataclass
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, NamedTuple, Optional
 
 try:
     import cv2
@@ -16,23 +23,81 @@ except ModuleNotFoundError as exc:
     ) from exc
 
 from blindaid.core import config
+from blindaid.core.async_mode import AsyncModeRunner
 from blindaid.core.audio import AudioPlayer
-from blindaid.core.caption import VisualAssistant
-from blindaid.core.depth import DepthAnalyzer
-from blindaid.core.speech_recognition import SpeechListener
-from blindaid.modes.guardian.guardian_mode import GuardianMode
-from blindaid.modes.ocr.reading_mode import ReadingMode
-from blindaid.modes.people.people_mode import PeopleMode
+from blindaid.core.camera import FrameGrabber
+from blindaid.core.overlay import OverlayLayer, TextItem
+
+if TYPE_CHECKING:
+    from blindaid.core.caption import VisualAssistant
+    from blindaid.core.depth import DepthAnalyzer
+    from blindaid.core.speech_recognition import SpeechListener
 
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+# Modes whose speech is a safety warning and must not wait behind other speech
+_URGENT_MODES = frozenset({"guardian"})
+
+# Hotkey codes as returned by pollKey() & 0xFF
+_KEY_QUIT = ord("q")
+_KEY_TO_MODE = {ord("0"): "sitting", ord("1"): "guardian", ord("2"): "reading"}
+_KEY_PEOPLE = ord("3")  # remembers the mode to return to, see _on_people_key
+_KEY_VQA = ord("4")
+_KEY_CAPTION = ord("5")
+_KEYS_TTS_TEST = (ord("t"), ord("T"))
+
+# (font scale, colour) of the static HUD text
+_HEADER_STYLE = (0.4, (0, 255, 255))
+_HINT_STYLE = (0.35, (200, 200, 200))
+
+# pollKey (OpenCV 4.5+) services the window without waitKey's 1 ms sleep
+_poll_key: Callable[[], int] = getattr(cv2, "pollKey", None) or (lambda: cv2.waitKey(1))
+
+
+def _lower_thread_priority() -> None:
+    # Linux applies nice() to the calling thread only; elsewhere it would
+    # slow the whole process, UI included
+    if config.PRELOAD_NICE and sys.platform.startswith("linux"):
+        try:
+            os.nice(config.PRELOAD_NICE)
+        except OSError as exc:
+            logger.debug("Could not lower preload priority: %s", exc)
+
+
+def _load_class(module_name: str, class_name: str) -> Any:
+    """Import a mode/model class on first use; these modules pull in torch etc."""
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+@dataclass(order=True)
 class OverlayMessage:
-    """temp message to show on screen"""
-    text: str
+    """temp message to show on screen, ordered by expiry for the heap"""
+    __slots__ = ("expires_at", "seq", "text")
+
     expires_at: float
+    seq: int
+    text: str  # never compared: seq is unique
+
+
+class ModeHandle(NamedTuple):
+    """A mode instance with its optional hooks looked up once (None if absent)."""
+    mode: Any
+    process_frame: Optional[Callable[[Any], Any]]
+    is_finished: Optional[Callable[[], bool]]
+    on_enter: Optional[Callable[[], None]]
+    on_exit: Optional[Callable[[], None]]
+
+    @classmethod
+    def for_mode(cls, mode: Any) -> ModeHandle:
+        return cls(
+            mode,
+            getattr(mode, "process_frame", None),
+            getattr(mode, "is_finished", None),
+            getattr(mode, "on_enter", None),
+            getattr(mode, "on_exit", None),
+        )
 
 
 class ModeController:
@@ -43,10 +108,12 @@ class ModeController:
         camera_index: Optional[int] = None,
         audio_enabled: Optional[bool] = None,
         initial_mode: str | None = None,
+        precision: str | None = None,
     ):
         self.camera_index = camera_index if camera_index is not None else config.DEFAULT_CAMERA_INDEX
         default_audio = config.AUDIO_ENABLED
         self.audio_enabled = default_audio if audio_enabled is None else (audio_enabled and default_audio)
+        self.precision = precision or config.MODEL_PRECISION
 
         self.audio_player: Optional[AudioPlayer]
         if self.audio_enabled:
@@ -64,11 +131,18 @@ class ModeController:
 
         self._mode_factories: dict[str, Callable[[], Any]] = {
             "sitting": lambda: None,
-            "guardian": lambda: GuardianMode(audio_enabled=self.audio_enabled),
-            "reading": lambda: ReadingMode(audio_enabled=self.audio_enabled, language=config.OCR_LANGUAGE),
-            "people": lambda: PeopleMode(audio_enabled=self.audio_enabled),
+            "guardian": lambda: _load_class("blindaid.modes.guardian.guardian_mode", "GuardianMode")(
+                audio_enabled=self.audio_enabled, precision=self.precision
+            ),
+            "reading": lambda: _load_class("blindaid.modes.ocr.reading_mode", "ReadingMode")(
+                audio_enabled=self.audio_enabled, language=config.OCR_LANGUAGE
+            ),
+            "people": lambda: _load_class("blindaid.modes.people.people_mode", "PeopleMode")(
+                audio_enabled=self.audio_enabled, precision=self.precision
+            ),
         }
-        self._mode_instances: dict[str, Any] = {}
+        self._mode_handles: dict[str, ModeHandle] = {}
+        self._current: Optional[ModeHandle] = None  # handle for current_mode_key once running
         self.mode_labels: dict[str, str] = {
             "sitting": "Sitting",
             "guardian": "Walking",
@@ -88,50 +162,75 @@ class ModeController:
         self.speech_listener: Optional[SpeechListener] = None
         self.depth_analyzer: Optional[DepthAnalyzer] = None
 
-        self.overlays: list[OverlayMessage] = []
+        self.overlays: list[OverlayMessage] = []  # heap, soonest expiry first
+        self._overlay_seq = itertools.count()
+        self._overlay_texts: Optional[tuple[str, ...]] = None  # cached _active_overlays()
+        self._overlay_layer = OverlayLayer()
+        self._mode_headers: dict[str, str] = {}
+        for key, label in self.mode_labels.items():
+            self._mode_headers[key] = f"M:{label}"
+            self._overlay_layer.sprites.pin(self._mode_headers[key], *_HEADER_STYLE)
+        self._overlay_layer.sprites.pin(config.SCENE_HINT_TEXT, *_HINT_STYLE)
         self.fps_counter = 0
-        self.fps_last_time = time.time()
+        self.fps_last_time = time.monotonic()
         self.fps_value = 0.0
+        self._fps_text = "FPS:--"
+        # people mode hands control back once it is done; polled every few frames
+        self._is_finished: Optional[Callable[[], bool]] = None
+        self._finished_check_counter = 0
+        self._recent_speech: OrderedDict[str, float] = OrderedDict()  # normalised text -> last spoken
         self._lock = threading.Lock()
 
         self._preload_thread: Optional[threading.Thread] = None
         self._preload_running = False
 
+        # process_frame runs on one worker so inference never blocks the UI
+        self._inference = AsyncModeRunner()
+
+        # key code -> handler(frame, display_frame, seq); False stops the loop
+        self._key_handlers: dict[int, Callable[[Any, Any, int], bool]] = {
+            _KEY_QUIT: self._on_quit_key,
+            _KEY_PEOPLE: lambda *_: self._on_people_key(),
+            _KEY_VQA: lambda frame, display_frame, seq: self._on_feature_key(
+                self._handle_vqa_request, frame, display_frame, seq
+            ),
+            _KEY_CAPTION: lambda frame, display_frame, seq: self._on_feature_key(
+                self._handle_caption_request, frame, display_frame, seq
+            ),
+        }
+        for code, mode_key in _KEY_TO_MODE.items():
+            self._key_handlers[code] = lambda *_, mode_key=mode_key: self._on_mode_key(mode_key)
+        for code in _KEYS_TTS_TEST:
+            self._key_handlers[code] = lambda *_: self._on_tts_test_key()
+
+        self._capture: Optional[cv2.VideoCapture] = None
+        self._grabber: Optional[FrameGrabber] = None
+        self._closed = False
+        atexit.register(self.shutdown)
+
     def _start_background_preload(self) -> None:
         if self._preload_running:
             return
         
         def preload_worker():
             try:
+                _lower_thread_priority()  # the load threads below inherit it
+                self._wait_for_smooth_ui()
                 logger.info("Background preload started")
-                time.sleep(2)  # Let the app start first
-                
-                # Preload in order of likely usage
+
+                # Load everything at once; total wait is the slowest model, not the sum.
+                # Daemon threads, so quitting mid-load never waits for a from_pretrained
                 preload_order = ["guardian", "reading", "people"]
-                
-                for mode_key in preload_order:
-                    if not self._preload_running:
-                        break
-                    try:
-                        logger.info("Preloading %s mode", mode_key)
-                        mode = self._get_mode(mode_key)
-                        ensure_hook = getattr(mode, "_ensure_loaded", None) or getattr(mode, "_ensure_ocr", None)
-                        if callable(ensure_hook):
-                            ensure_hook()
-                        time.sleep(1)
-                    except Exception as e:
-                        logger.debug("Preload failed for %s: %s", mode_key, e)
-                
-                # Preload visual assistant for caption/VQA
-                if self._preload_running:
-                    try:
-                        logger.info("Preloading visual assistant...")
-                        if self.visual_assistant is None:
-                            self.visual_assistant = VisualAssistant(device=getattr(config, "CAPTION_DEVICE", "cpu"))
-                        self.visual_assistant._ensure_caption_model()
-                    except Exception as e:
-                        logger.debug("Preload failed for visual assistant: %s", e)
-                
+                loaders = [
+                    threading.Thread(target=self._preload_mode, args=(mode_key,), daemon=True)
+                    for mode_key in preload_order
+                ]
+                loaders.append(threading.Thread(target=self._preload_visual_assistant, daemon=True))
+                for loader in loaders:
+                    loader.start()
+                for loader in loaders:
+                    loader.join()
+
                 logger.info("Background preload complete")
             except Exception as e:
                 logger.error("Background preload error: %s", e)
@@ -139,27 +238,82 @@ class ModeController:
         self._preload_running = True
         self._preload_thread = threading.Thread(target=preload_worker, daemon=True)
         self._preload_thread.start()
+
+    def _wait_for_smooth_ui(self) -> None:
+        """Block until the main loop reaches PRELOAD_MIN_FPS, or PRELOAD_MAX_WAIT_SECONDS pass."""
+        deadline = time.monotonic() + config.PRELOAD_MAX_WAIT_SECONDS
+        while self._preload_running and time.monotonic() < deadline:
+            if self.fps_value >= config.PRELOAD_MIN_FPS:
+                return
+            time.sleep(0.1)
+
+    def _preload_mode(self, mode_key: str) -> None:
+        if not self._preload_running:
+            return
+        try:
+            logger.info("Preloading %s mode", mode_key)
+            self._warm_mode(mode_key)
+        except Exception as e:
+            logger.debug("Preload failed for %s: %s", mode_key, e)
+
+    def _preload_visual_assistant(self) -> None:
+        # Caption model only; VQA loads on first question
+        if not self._preload_running:
+            return
+        try:
+            logger.info("Preloading visual assistant...")
+            self._ensure_visual_assistant()._ensure_caption_model()
+        except Exception as e:
+            logger.debug("Preload failed for visual assistant: %s", e)
     
-    def _get_mode(self, key: str) -> object:
+    def _warm_mode(self, key: str) -> None:
+        """Instantiate a mode and load its model weights."""
+        mode = self._get_mode(key)
+        ensure_hook = getattr(mode, "_ensure_loaded", None) or getattr(mode, "_ensure_ocr", None)
+        if callable(ensure_hook):
+            ensure_hook()
+
+    def _start_initial_warmup(self) -> threading.Thread:
+        """Load the start mode's model while the camera is being opened."""
+        def warmup_worker():
+            try:
+                self._warm_mode(self.current_mode_key)
+            except Exception as exc:  # noqa: BLE001
+                logger.debug("Warmup failed for %s: %s", self.current_mode_key, exc)
+
+        thread = threading.Thread(target=warmup_worker, daemon=True)
+        thread.start()
+        return thread
+
+    def _get_handle(self, key: str) -> ModeHandle:
         with self._lock:
             factory = self._mode_factories.get(key)
             if factory is None:
                 raise KeyError(key)
-            if key not in self._mode_instances:
+            if key not in self._mode_handles:
                 logger.info("Lazy-loading %s mode", key)
-                self._mode_instances[key] = factory()
-            return self._mode_instances[key]
+                self._mode_handles[key] = ModeHandle.for_mode(factory())
+            return self._mode_handles[key]
 
-    def _switch_mode(self, target_key: str) -> None:
+    def _get_mode(self, key: str) -> object:
+        return self._get_handle(key).mode
+
+    def _switch_mode(self, target_key: str) -> Optional[ModeHandle]:
+        """Switch modes and return the handle of the mode now current."""
         if target_key == self.current_mode_key:
-            return
+            return self._current
         if target_key not in self._mode_factories:
             logger.warning("Unknown mode key requested: %s", target_key)
-            return
+            return self._current
 
         logger.info("Switching mode: %s -> %s", self.current_mode_key, target_key)
-        current = self._get_mode(self.current_mode_key)
-        if hasattr(current, "on_exit"):
+        # Let the old mode finish its frame before on_exit touches its state
+        self._speak_messages(
+            self._inference.collect(wait=True), dedupe=True, urgent=self.current_mode_key in _URGENT_MODES
+        )
+        self._inference.reset()
+        current = self._get_handle(self.current_mode_key)
+        if current.on_exit is not None:
             try:
                 current.on_exit()
             except Exception as exc:  # noqa: BLE001
@@ -167,61 +321,134 @@ class ModeController:
 
         self.current_mode_key = target_key
 
-        new_mode = self._get_mode(self.current_mode_key)
-        if hasattr(new_mode, "on_enter"):
+        new_mode = self._get_handle(self.current_mode_key)
+        if new_mode.on_enter is not None:
             try:
                 new_mode.on_enter()
             except Exception as exc:  # noqa: BLE001
                 logger.debug("Mode on_enter failed: %s", exc)
+        self._current = new_mode
+        self._track_finish(new_mode)
+        self._apply_decode_stride()
 
         self._add_overlay(f"Switched to {self.mode_labels[self.current_mode_key]} mode", duration=2.5)
+        return new_mode
+
+    def _apply_decode_stride(self) -> None:
+        # Sitting mode only shows frames, so it can skip decoding some of them
+        if self._grabber is not None:
+            idle = self.current_mode_key == "sitting"
+            self._grabber.decode_every = config.IDLE_DECODE_STRIDE if idle else 1
+
+    def _track_finish(self, handle: ModeHandle) -> None:
+        self._is_finished = handle.is_finished if self.current_mode_key == "people" else None
+        self._finished_check_counter = 0
 
     def _add_overlay(self, text: str, duration: float = 4.0) -> None:
-        expiry = time.time() + duration
-        self.overlays.append(OverlayMessage(text=text, expires_at=expiry))
-
-    def _active_overlays(self) -> list[str]:
-        now = time.time()
-        active: list[OverlayMessage] = []
-        messages: list[str] = []
-        for overlay in self.overlays:
-            if overlay.expires_at > now:
-                active.append(overlay)
-                messages.append(overlay.text)
-        self.overlays = active
-        return messages
-
-    def _speak_messages(self, messages: Sequence[str]) -> None:
+        expiry = time.monotonic() + duration
+        heapq.heappush(self.overlays, OverlayMessage(expiry, next(self._overlay_seq), text))
+        self._overlay_texts = None
+
+    def _active_overlays(self, now: float) -> tuple[str, ...]:
+        """Texts of unexpired overlays, rebuilt only when one is added or expires."""
+        while self.overlays and self.overlays[0].expires_at <= now:
+            heapq.heappop(self.overlays)
+            self._overlay_texts = None
+        if self._overlay_texts is None:
+            # Heap order is by expiry; show messages in the order they were added
+            ordered = sorted(self.overlays, key=lambda overlay: overlay.seq)
+            self._overlay_texts = tuple(overlay.text for overlay in ordered)
+        return self._overlay_texts
+
+    def _speak_messages(self, messages: Sequence[str], dedupe: bool = False, urgent: bool = False) -> None:
+        """Speak messages; with dedupe, skip ones spoken within SPEECH_DEDUP_WINDOW.
+
+        Urgent messages jump ahead of (and cut off) ordinary speech. They are
+        never deduped: guardian paces its warnings with its own cooldown.
+        """
         if not messages:
             return
+        now = time.monotonic()
         for message in messages:
             if not message:
                 continue
+            if dedupe and not urgent and self._is_recent_speech(message, now):
+                continue
             if self.audio_player is not None:
-                self.audio_player.speak(message)
+                self.audio_player.speak(message, urgent=urgent)
             else:
                 logger.info("Speech: %s", message)
 
-    def _update_fps(self) -> None:
+    def _is_recent_speech(self, message: str, now: float) -> bool:
+        key = message.strip().lower()
+        last_spoken = self._recent_speech.get(key)
+        if last_spoken is not None and now - last_spoken < config.SPEECH_DEDUP_WINDOW:
+            return True
+        self._recent_speech[key] = now
+        self._recent_speech.move_to_end(key)
+        if len(self._recent_speech) > 16:
+            self._recent_speech.popitem(last=False)
+        return False
+
+    def _update_fps(self, now: float) -> None:
         self.fps_counter += 1
         if self.fps_counter >= 20:
-            now = time.time()
             elapsed = now - self.fps_last_time
             if elapsed > 0:
                 self.fps_value = self.fps_counter / elapsed
+                self._fps_text = f"FPS:{self.fps_value:.0f}"
             self.fps_counter = 0
             self.fps_last_time = now
 
     def _ensure_visual_assistant(self) -> VisualAssistant:
-        if self.visual_assistant is None:
-            self.visual_assistant = VisualAssistant()
-        return self.visual_assistant
+        # Also called from the preload pool, so create it only once
+        with self._lock:
+            if self.visual_assistant is None:
+                visual_assistant_cls = _load_class("blindaid.core.caption", "VisualAssistant")
+                self.visual_assistant = visual_assistant_cls(precision=self.precision)
+            return self.visual_assistant
 
     def _ensure_speech_listener(self) -> SpeechListener:
         if self.speech_listener is None:
-            self.speech_listener = SpeechListener()
+            self.speech_listener = _load_class("blindaid.core.speech_recognition", "SpeechListener")()
         return self.speech_listener
 
+    def _on_quit_key(self, *_: Any) -> bool:
+        logger.info("Quit requested by user")
+        return False
+
+    def _on_mode_key(self, mode_key: str) -> bool:
+        self._switch_mode(mode_key)
+        return True
+
+    def _on_people_key(self) -> bool:
+        if self.current_mode_key != "people":
+            self.previous_mode_key = self.current_mode_key
+            self._switch_mode("people")
+        return True
+
+    def _on_feature_key(self, handler: Callable[[Any], None], frame, display_frame, seq: int) -> bool:
+        handler(self._clean_frame(frame, display_frame, seq))
+        return True
+
+    def _on_tts_test_key(self) -> bool:
+        self._add_overlay("TTS Test", duration=2.0)
+        self._speak_messages(["Audio check one two three."])
+        return True
+
+    def _clean_frame(self, frame, display_frame, seq: int):
+        """Return a camera frame without HUD text for the caption/VQA models."""
+        if display_frame is not frame or self._grabber is None:
+            return frame
+        # The HUD was drawn onto this frame; wait briefly for the next one
+        deadline = time.monotonic() + 0.2
+        while time.monotonic() < deadline:
+            latest, latest_seq = self._grabber.read_latest()
+            if latest_seq != seq and latest is not None:
+                return latest
+            time.sleep(0.005)
+        return frame
+
     def _handle_caption_request(self, frame) -> None:
         try:
             self._add_overlay("Analyzing scene...", duration=2.0)
@@ -246,10 +473,12 @@ class ModeController:
             self._add_overlay("Listening... (Speak now)", duration=5.0)
             self._speak_messages(["Listening..."])
             cv2.waitKey(1)  # Update UI
-            
-            # Pause briefly to let TTS start/finish "Listening"
-            time.sleep(0.5)
-            
+
+            # speak() only queues the prompt, so the mic normally opens (and
+            # calibrates for ambient noise) while it plays
+            if config.TTS_MIC_HALF_DUPLEX:
+                time.sleep(0.5)
+
             question = listener.listen_for_command(timeout=5)
             
             if not question:
@@ -278,66 +507,50 @@ class ModeController:
             self._add_overlay("Error processing question", duration=3.0)
             self._speak_messages(["Sorry, I encountered an error."])
 
+    @staticmethod
+    def _fit_display(frame, copy: bool = False):
+        """Shrink frame to DISPLAY_MAX_WIDTH for drawing and imshow.
+
+        Resizing already yields a new array; otherwise copy only if asked.
+        """
+        max_width = config.DISPLAY_MAX_WIDTH
+        width = frame.shape[1]
+        if max_width and width > max_width:
+            scale = max_width / width
+            return cv2.resize(frame, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        return frame.copy() if copy else frame
+
     def _draw_overlay_text(self, frame, info_lines: Sequence[str], extra_lines: Sequence[str]) -> None:
         h, w = frame.shape[:2]
         header_y = 20
-        mode_label = self.mode_labels.get(self.current_mode_key, self.current_mode_key)
-        cv2.putText(
-            frame,
-            f"M:{mode_label}",
-            (5, header_y),
-            cv2.FONT_HERSHEY_SIMPLEX,
-            0.4,
-            (0, 255, 255),
-            1,
-        )
-
-        fps_text = f"FPS:{self.fps_value:.0f}" if self.fps_value else "FPS:--"
-        cv2.putText(
-            frame,
-            fps_text,
-            (w - 60, header_y),
-            cv2.FONT_HERSHEY_SIMPLEX,
-            0.4,
-            (0, 255, 0),
-            1,
-        )
+        items: list[TextItem] = [
+            (self._mode_headers[self.current_mode_key], (5, header_y), *_HEADER_STYLE),
+            (self._fps_text, (w - 60, header_y), 0.4, (0, 255, 0)),
+        ]
 
         lines_to_draw: list[str] = list(info_lines)
         for overlay in extra_lines:
             lines_to_draw.append(overlay)
 
-        # Draw the static hint text at the very bottom
+        # Static hint text at the very bottom
         bottom_y = h - 5
-        cv2.putText(
-            frame,
-            config.SCENE_HINT_TEXT,
-            (5, bottom_y),
-            cv2.FONT_HERSHEY_SIMPLEX,
-            0.35,
-            (200, 200, 200),
-            1,
-        )
+        items.append((config.SCENE_HINT_TEXT, (5, bottom_y), *_HINT_STYLE))
 
-        # Draw dynamic messages above the hint text
+        # Dynamic messages above the hint text
         bottom_y -= 18
         for line in reversed(lines_to_draw[-6:]):
-            cv2.putText(
-                frame,
-                line,
-                (5, bottom_y),
-                cv2.FONT_HERSHEY_SIMPLEX,
-                0.4,
-                (255, 255, 255),
-                1,
-            )
+            items.append((line, (5, bottom_y), 0.4, (255, 255, 255)))
             bottom_y -= 16
 
+        self._overlay_layer.compose(frame, items)
+
     def run(self) -> None:
         logger.info("Starting BlindAid controller (camera %s)", self.camera_index)
+        warmup_thread = self._start_initial_warmup()
         cv2.namedWindow(self.WINDOW_NAME, cv2.WINDOW_NORMAL)
 
         capture = cv2.VideoCapture(self.camera_index)
+        self._capture = capture
         if not capture.isOpened():
             logger.error("Unable to open camera index %s", self.camera_index)
             return
@@ -346,88 +559,122 @@ class ModeController:
             capture.set(cv2.CAP_PROP_FRAME_WIDTH, config.FRAME_WIDTH)
         if config.FRAME_HEIGHT:
             capture.set(cv2.CAP_PROP_FRAME_HEIGHT, config.FRAME_HEIGHT)
+        if config.CAPTURE_BUFFER_SIZE:
+            # Not every backend honours this; the grabber drains the rest
+            capture.set(cv2.CAP_PROP_BUFFERSIZE, config.CAPTURE_BUFFER_SIZE)
+
+        grabber = FrameGrabber(capture).start()
+        self._grabber = grabber
 
+        # on_enter may load the same model, so let the warmup finish first
+        warmup_thread.join()
         self._start_background_preload()
 
-        initial_mode = self._get_mode(self.current_mode_key)
-        if hasattr(initial_mode, "on_enter"):
+        initial_mode = self._get_handle(self.current_mode_key)
+        if initial_mode.on_enter is not None:
             try:
                 initial_mode.on_enter()
             except Exception as exc:  # noqa: BLE001
                 logger.debug("Initial on_enter failed: %s", exc)
+        self._current = initial_mode
+        self._track_finish(initial_mode)
+        self._apply_decode_stride()
 
         self._add_overlay("System Ready. Sitting Mode.", duration=3.0)
         self._speak_messages(["BlindAid Online. Ready."])
 
         try:
+            last_seq = 0
+            last_render = 0.0
+            # 3/4 of the frame period, so a camera running at the cap with some
+            # jitter is not cut down to every other frame
+            render_gap = 0.75 / config.DISPLAY_MAX_FPS if config.DISPLAY_MAX_FPS else 0.0
             while True:
-                ret, frame = capture.read()
-                if not ret:
+                if grabber.failed:
                     logger.warning("Camera frame grab failed, stopping controller")
                     break
-
-                current_mode = self._get_mode(self.current_mode_key)
-                if (
-                    self.current_mode_key == "people"
-                    and hasattr(current_mode, "is_finished")
-                    and current_mode.is_finished()
-                ):
-                    self._switch_mode(self.previous_mode_key)
-                    current_mode = self._get_mode(self.current_mode_key)
-
-                if current_mode is None or not hasattr(current_mode, "process_frame"):
-                    display_frame = frame.copy()
-                    info_lines: Sequence[str] = ["Sitting Mode - Press 1-5 for features"]
-                    speech_messages: list[str] = []
+                frame, seq = grabber.wait_latest(last_seq)
+                if frame is None or seq == last_seq:
+                    continue
+                last_seq = seq
+
+                # Urgency follows the mode that produced the speech, not the one switched to below
+                speech_urgent = self.current_mode_key in _URGENT_MODES
+                speech_messages = self._inference.collect()
+                current_mode = self._current
+                if self._is_finished is not None:
+                    self._finished_check_counter += 1
+                    if self._finished_check_counter % 5 == 0 and self._is_finished():
+                        current_mode = self._switch_mode(self.previous_mode_key)
+                assert current_mode is not None
+                if current_mode.process_frame is not None:
+                    self._inference.offer(current_mode.process_frame, frame)
+
+                self._speak_messages(speech_messages, dedupe=True, urgent=speech_urgent)
+
+                # Inference has seen this frame; only draw it at the display rate
+                now = time.monotonic()
+                if now - last_render < render_gap:
+                    continue
+                last_render = now
+
+                info_lines: Sequence[str]
+                if current_mode.process_frame is None:
+                    # The grabber leaves this buffer alone until the next read_latest()
+                    display_frame = self._fit_display(frame)
+                    info_lines = ["Sitting Mode - Press 1-5 for features"]
+                # Show the latest finished result until the next one lands
+                elif self._inference.last_display is None:
+                    display_frame, info_lines = self._fit_display(frame, copy=True), []
                 else:
-                    display_frame, info_lines, speech_messages = current_mode.process_frame(frame)
-
-                self._speak_messages(speech_messages)
+                    display_frame = self._fit_display(self._inference.last_display, copy=True)
+                    info_lines = self._inference.last_info
 
-                self._update_fps()
-                overlay_texts = self._active_overlays()
+                self._update_fps(now)
+                overlay_texts = self._active_overlays(now)
                 self._draw_overlay_text(display_frame, info_lines, overlay_texts)
 
                 cv2.imshow(self.WINDOW_NAME, display_frame)
 
-                key = cv2.waitKey(1) & 0xFF
-                if key == ord("q"):
-                    logger.info("Quit requested by user")
+                handler = self._key_handlers.get(_poll_key() & 0xFF)
+                if handler is not None and not handler(frame, display_frame, seq):
                     break
 
-                if key == ord("0"):
-                    self._switch_mode("sitting")
-                elif key == ord("1"):
-                    self._switch_mode("guardian")
-                elif key == ord("2"):
-                    self._switch_mode("reading")
-                elif key == ord("3") and self.current_mode_key != "people":
-                    self.previous_mode_key = self.current_mode_key
-                    self._switch_mode("people")
-                elif key == ord("4"):
-                    self._handle_vqa_request(frame)
-                elif key == ord("5"):
-                    self._handle_caption_request(frame)
-                elif key in (ord("t"), ord("T")):
-                    self._add_overlay("TTS Test", duration=2.0)
-                    self._speak_messages(["Audio check one two three."])
-
             logger.info("Controller loop exited")
         finally:
-            self._preload_running = False
-            if self._preload_thread and self._preload_thread.is_alive():
-                self._preload_thread.join(timeout=1.0)
-
-            capture.release()
-            cv2.destroyAllWindows()
-            for mode in self._mode_instances.values():
-                if hasattr(mode, "on_exit"):
-                    try:
-                        mode.on_exit()
-                    except Exception:  # noqa: BLE001
-                        pass
-            if self.audio_player is not None:
-                self.audio_player.shutdown()
+            self.shutdown()
+
+    def shutdown(self) -> None:
+        """Release the camera, windows, modes and audio. Safe to call twice."""
+        if self._closed:
+            return
+        self._closed = True
+
+        self._preload_running = False
+        if self._preload_thread and self._preload_thread.is_alive():
+            self._preload_thread.join(timeout=1.0)
+
+        self._inference.shutdown()
+        capture_idle = True
+        if self._grabber is not None:
+            capture_idle = self._grabber.stop()
+            self._grabber = None
+        if self._capture is not None:
+            if capture_idle:
+                self._capture.release()
+            else:
+                # Releasing under a grab() still in native code can crash; the OS frees it at exit
+                logger.warning("Camera read did not return, leaving the capture open")
+            self._capture = None
+        cv2.destroyAllWindows()
+        for handle in self._mode_handles.values():
+            if handle.on_exit is not None:
+                try:
+                    handle.on_exit()
+                except Exception:  # noqa: BLE001
+                    pass
+        if self.audio_player is not None:
+            self.audio_player.shutdown()
 
 
 __all__ = ["ModeController"]
@@ -0,0 +1,52 @@
+"""Runs a mode's process_frame off the UI thread."""
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Optional
+
+import numpy as np
+
+# process_frame(frame) -> (display_frame, info_lines, speech_messages)
+ProcessFrame = Callable[[np.ndarray], Any]
+
+
+class AsyncModeRunner:
+    """Runs process_frame for the active mode on a single worker thread.
+
+    At most one frame is in flight. Frames offered while the worker is busy
+    are dropped, so every inference starts on the newest frame. The last
+    finished (display frame, info lines) pair is kept for redrawing.
+    """
+
+    def __init__(self) -> None:
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="blindaid-mode")
+        self._pending: Optional[Future] = None
+        self.last_display: Optional[np.ndarray] = None
+        self.last_info: Sequence[str] = ()
+
+    def offer(self, process_frame: ProcessFrame, frame: np.ndarray) -> bool:
+        """Start processing a copy of frame unless a frame is already in flight."""
+        if self._pending is not None:
+            return False
+        self._pending = self._pool.submit(process_frame, frame.copy())
+        return True
+
+    def collect(self, wait: bool = False) -> list[str]:
+        """Store a finished result and return its speech; wait blocks for it."""
+        future = self._pending
+        if future is None or not (wait or future.done()):
+            return []
+        self._pending = None
+        display_frame, info_lines, speech_messages = future.result()
+        self.last_display = display_frame
+        self.last_info = info_lines
+        return list(speech_messages)
+
+    def reset(self) -> None:
+        """Forget the last result, e.g. after a mode switch."""
+        self.last_display = None
+        self.last_info = ()
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=True)
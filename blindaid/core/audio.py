@@ -1,18 +1,62 @@
-"""TTS using gTTS + pygame. pyttsx3 was crashing so switched to this."""
+"""TTS using gTTS + pygame. pyttsx3 was crashing so switched to this.
+
+pyttsx3 is still used when use_online is False (no network round trip per
+message); if it cannot start, playback falls back to gTTS. Fixed phrases can
+be rendered ahead of time with prerender_clips() and then play from disk;
+everything else gTTS returns is kept in a size-bounded disk cache.
+"""
 from __future__ import annotations
 
+import hashlib
+import io
 import logging
 import os
-import tempfile
 import time
+from collections import OrderedDict, deque
 from pathlib import Path
-from queue import Empty, Full, Queue
-from threading import Event, Thread
+from threading import Condition, Event, Thread
+from typing import Iterable
+
+from blindaid.core import config
 
 os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
 
 logger = logging.getLogger(__name__)
 
+# Synthesised gTTS clips kept in memory; app phrases repeat a lot
+_MP3_CACHE_SIZE = 128
+# Queued messages are joined up to this length, gTTS's per-request chunk size
+_BATCH_MAX_CHARS = 100
+# How often playback checks whether the clip ended; stop/interrupt wake it at once
+_PLAYBACK_POLL_SECONDS = 0.03
+
+
+def _clip_name(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def _clip_path(text: str) -> Path:
+    return config.TTS_CLIPS_DIR / f"{_clip_name(text)}.mp3"
+
+
+def prerender_clips(phrases: Iterable[str]) -> int:
+    """Synthesise missing clips for phrases with gTTS; returns how many were written."""
+    from gtts import gTTS
+
+    config.TTS_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
+    written = 0
+    for phrase in phrases:
+        path = _clip_path(phrase)
+        if path.exists():
+            continue
+        buffer = io.BytesIO()
+        gTTS(text=phrase, lang="en").write_to_fp(buffer)
+        path.write_bytes(buffer.getvalue())
+        logger.info("Rendered clip for %r", phrase)
+        written += 1
+    return written
+
+
 class AudioPlayer:
     """Plays TTS in background thread so video doesnt freeze."""
 
@@ -20,108 +64,297 @@ class AudioPlayer:
         self.rate = rate
         self.volume = volume
         self.use_online = use_online
-        self._pygame_initialized = False
-        self.queue: Queue[str | None] = Queue(maxsize=10)
+        # pygame (with its mixer initialised) and gTTS, imported once on the worker
+        self._pygame = None
+        self._gtts = None
+        self._engine = None  # pyttsx3 engine, created on the worker thread
+        self._mp3_cache: OrderedDict[str, bytes] = OrderedDict()
+        try:
+            self._clips = {path.stem for path in config.TTS_CLIPS_DIR.glob("*.mp3")}
+        except OSError:
+            self._clips = set()
+        # Clip name -> file size, least recently played first; filled by the worker
+        self._disk_cache: OrderedDict[str, int] = OrderedDict()
+        self._disk_cache_bytes = 0
+        # Oldest waiting message is dropped when full; urgent ones go to the front
+        self._pending: deque[tuple[str, bool]] = deque(maxlen=10)  # (message, urgent)
+        self._pending_ready = Condition()
+        self._playing_urgent = False
+        self._interrupt = Event()  # cuts the current utterance short for an urgent one (also set on shutdown)
         self._stop = Event()
-        self.worker_thread = Thread(target=self._worker, daemon=True)
-        self.worker_thread.start()
+        # Started by the first speak(), so the mixer/voice load only if needed
+        self.worker_thread: Thread | None = None
         logger.info("Audio player ready (online=%s)", self.use_online)
 
     def _worker(self):
-        self.use_online = True
+        if not self.use_online:
+            self._ensure_offline_engine()  # load the voice before the first message
+        else:
+            self._load_disk_cache()
 
         while not self._stop.is_set():
             try:
-                message = self.queue.get(timeout=0.5)
-                if message is None:  # Poison pill
-                    self.queue.task_done()
-                    break
-                
+                with self._pending_ready:
+                    self._pending_ready.wait_for(lambda: self._pending or self._stop.is_set())
+                    if self._stop.is_set():
+                        break
+                    message, self._playing_urgent = self._pending.popleft()
+                    if not self._playing_urgent:
+                        message = self._coalesce(message)
+                    self._interrupt.clear()
+
                 logger.debug("Playing audio: %s", message)
-                
-                self._ensure_pygame()
-                self._speak_gtts(message)
 
-                self.queue.task_done()
-            except Empty:
-                continue
+                if self.use_online or self._ensure_offline_engine() is None:
+                    self._speak_gtts(self._ensure_pygame(), message)
+                else:
+                    self._speak_offline(message)
             except Exception as exc:  # noqa: BLE001
                 if not self._stop.is_set():
                     logger.exception("Audio playback error: %s", exc)
 
-    def _speak_gtts(self, text: str):
-        temp_path: Path | None = None
+        if self._engine is not None:
+            try:
+                self._engine.endLoop()
+            except Exception:  # noqa: BLE001
+                pass
+
+    def _coalesce(self, message: str) -> str:
+        """Join short queued messages into one utterance (one gTTS request).
+
+        Called with the queue lock held. Cached clips play without a request,
+        so they are not merged into a new, uncached text.
+        """
+        if not self.use_online or self._has_clip(message):
+            return message
+        parts = [message]
+        length = len(message)
+        while self._pending:
+            queued, urgent = self._pending[0]
+            if urgent or self._has_clip(queued) or length + len(queued) + 1 > _BATCH_MAX_CHARS:
+                break
+            self._pending.popleft()
+            parts.append(queued)
+            length += len(queued) + 1
+        if len(parts) == 1:
+            return message
+        return " ".join(part if part[-1:] in ".!?" else part + "." for part in parts)
+
+    def _load_disk_cache(self) -> None:
+        """Index the disk cache by last use, dropping clips past the max age."""
+        cache_dir = config.TTS_DISK_CACHE_DIR
         try:
-            from gtts import gTTS
-            import pygame
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            entries = [(path, path.stat()) for path in cache_dir.glob("*.mp3")]
+        except OSError as exc:
+            logger.debug("TTS disk cache unavailable: %s", exc)
+            return
+        oldest = time.time() - config.TTS_DISK_CACHE_MAX_AGE_DAYS * 86400
+        for path, stat in sorted(entries, key=lambda entry: entry[1].st_mtime):
+            if stat.st_mtime < oldest:
+                path.unlink(missing_ok=True)
+                continue
+            self._disk_cache[path.stem] = stat.st_size
+            self._disk_cache_bytes += stat.st_size
+        self._trim_disk_cache()
 
-            if not pygame.mixer.get_init():
-                pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=4096)
-            self._pygame_initialized = True
-
-            tts = gTTS(text=text, lang="en")
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".mp3") as fp:
-                temp_path = Path(fp.name)
-
-            tts.save(temp_path.as_posix())
-            pygame.mixer.music.load(temp_path.as_posix())
-            pygame.mixer.music.play()
-            while pygame.mixer.music.get_busy():
-                if self._stop.is_set():
-                    pygame.mixer.music.stop()
-                    break
-                time.sleep(0.1)
+    def _trim_disk_cache(self) -> None:
+        while self._disk_cache and self._disk_cache_bytes > config.TTS_DISK_CACHE_MAX_BYTES:
+            name, size = self._disk_cache.popitem(last=False)
+            self._disk_cache_bytes -= size
+            (config.TTS_DISK_CACHE_DIR / f"{name}.mp3").unlink(missing_ok=True)
 
-            try:
-                pygame.mixer.music.unload()
-            except Exception:
-                try:
-                    pygame.mixer.music.stop()
-                except Exception:
-                    pass
+    def _store_disk_cache(self, text: str, mp3: bytes) -> None:
+        name = _clip_name(text)
+        if name in self._clips or name in self._disk_cache:
+            return
+        try:
+            (config.TTS_DISK_CACHE_DIR / f"{name}.mp3").write_bytes(mp3)
+        except OSError as exc:
+            logger.debug("Could not write TTS cache entry: %s", exc)
+            return
+        self._disk_cache[name] = len(mp3)
+        self._disk_cache_bytes += len(mp3)
+        self._trim_disk_cache()
+
+    def _remember(self, text: str, mp3: bytes) -> None:
+        self._mp3_cache[text] = mp3
+        if len(self._mp3_cache) > _MP3_CACHE_SIZE:
+            self._mp3_cache.popitem(last=False)
+
+    def _has_clip(self, text: str) -> bool:
+        if text in self._mp3_cache:
+            return True
+        name = _clip_name(text)
+        return name in self._clips or name in self._disk_cache
+
+    def _cached_mp3(self, text: str) -> bytes | None:
+        """MP3 for text from memory, the pre-rendered clips or the disk cache."""
+        mp3 = self._mp3_cache.get(text)
+        if mp3 is not None:
+            self._mp3_cache.move_to_end(text)
+            return mp3
+        name = _clip_name(text)
+        if name in self._clips:
+            path = config.TTS_CLIPS_DIR / f"{name}.mp3"
+        elif name in self._disk_cache:
+            path = config.TTS_DISK_CACHE_DIR / f"{name}.mp3"
+        else:
+            return None
+        try:
+            mp3 = path.read_bytes()
+            if name in self._disk_cache:
+                os.utime(path)  # mtime is the last use across sessions
+                self._disk_cache.move_to_end(name)
+        except OSError:
+            self._clips.discard(name)
+            self._disk_cache_bytes -= self._disk_cache.pop(name, 0)
+            return None
+        self._remember(text, mp3)
+        return mp3
+
+    def _speak_gtts(self, pygame, text: str):
+        try:
+            mp3 = self._cached_mp3(text)
+            if mp3 is not None:
+                self._play_mp3(pygame, mp3)
+                self._wait_playback(pygame)
+            else:
+                # gTTS fetches long text in ~100 char parts; play each part
+                # while the next one downloads
+                if self._gtts is None:
+                    from gtts import gTTS
+
+                    self._gtts = gTTS
+                parts: list[bytes] = []
+                for part in self._gtts(text=text, lang="en").stream():
+                    if not self._wait_playback(pygame):
+                        break
+                    self._play_mp3(pygame, part)
+                    parts.append(part)
+                else:
+                    if self._wait_playback(pygame):
+                        # MP3 frames concatenate, so the parts replay as one clip
+                        mp3 = b"".join(parts)
+                        self._remember(text, mp3)
+                        self._store_disk_cache(text, mp3)
         except ImportError:
-            logger.error("gTTS or pygame not installed. Cannot play audio.")
+            logger.error("gTTS not installed. Cannot play audio.")
         except Exception as exc:
             logger.error("gTTS playback failed: %s", exc)
-        finally:
-            if temp_path is not None:
-                temp_path.unlink(missing_ok=True)
-        return
+
+    @staticmethod
+    def _play_mp3(pygame, mp3: bytes):
+        # pygame >= 2 decodes straight from a file object given a type hint.
+        # load() releases the previous clip itself, so nothing is unloaded
+        # between utterances.
+        pygame.mixer.music.load(io.BytesIO(mp3), "mp3")
+        pygame.mixer.music.play()
+
+    def _wait_playback(self, pygame) -> bool:
+        """Wait for the current clip to end; False if stopped or interrupted."""
+        while pygame.mixer.music.get_busy():
+            if self._stop.is_set() or self._interrupt.is_set():
+                pygame.mixer.music.stop()
+                return False
+            self._interrupt.wait(_PLAYBACK_POLL_SECONDS)
+        return not (self._stop.is_set() or self._interrupt.is_set())
+
+    def _ensure_offline_engine(self):
+        if self._engine is None and not self.use_online:
+            try:
+                import pyttsx3
+
+                engine = pyttsx3.init()
+                engine.setProperty("rate", self.rate)
+                engine.setProperty("volume", self.volume)
+                # Drive the event loop ourselves (iterate) so speech can be cut off
+                engine.startLoop(False)
+                self._engine = engine
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("Offline TTS unavailable, falling back to gTTS: %s", exc)
+                self.use_online = True
+        return self._engine
+
+    def _speak_offline(self, text: str):
+        engine = self._engine
+        try:
+            engine.say(text)
+            engine.iterate()
+            while engine.isBusy():
+                if self._stop.is_set() or self._interrupt.is_set():
+                    engine.stop()
+                    break
+                engine.iterate()
+                self._interrupt.wait(0.02)
+        except Exception as exc:  # noqa: BLE001
+            logger.error("pyttsx3 playback failed: %s", exc)
 
     def _ensure_pygame(self):
-        if self._pygame_initialized:
-            return
+        if self._pygame is not None:
+            return self._pygame
         try:
             import pygame
 
             if not pygame.mixer.get_init():
                 pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=4096)
-            self._pygame_initialized = True
+            self._pygame = pygame
+            return pygame
         except Exception as exc:  # noqa: BLE001
             logger.exception("Failed to initialize pygame mixer: %s", exc)
             raise
 
-    def speak(self, message: str):
-        try:
-            self.queue.put_nowait(message)
-        except Full:
-            logger.warning("Audio queue full, skipping message")
+    def _make_room(self, urgent: bool) -> bool:
+        """Free a queue slot for a new message; False if it should be dropped.
+
+        Called with the queue lock held. A full queue gives up its oldest
+        non-urgent message, never a queued warning for a non-urgent one.
+        """
+        if len(self._pending) < self._pending.maxlen:
+            return True
+        for index, (_, queued_urgent) in enumerate(self._pending):
+            if not queued_urgent:
+                del self._pending[index]
+                logger.debug("Audio queue full, dropping the oldest non-urgent message")
+                return True
+        if not urgent:
+            logger.debug("Audio queue full of warnings, dropping a non-urgent message")
+            return False
+        # Only warnings queued: the newest one describes the current scene
+        self._pending.popleft()
+        logger.debug("Audio queue full of warnings, dropping the oldest one")
+        return True
+
+    def speak(self, message: str, urgent: bool = False):
+        """Queue a message without blocking; a full queue drops its oldest non-urgent one.
+
+        Urgent messages (hazard warnings) jump the queue and cut off a
+        non-urgent message that is already playing.
+        """
+        with self._pending_ready:
+            if self.worker_thread is None and not self._stop.is_set():
+                self.worker_thread = Thread(target=self._worker, daemon=True)
+                self.worker_thread.start()
+            if urgent:
+                self._make_room(urgent=True)
+                # Behind any urgent messages already waiting, ahead of the rest
+                position = sum(1 for _, queued_urgent in self._pending if queued_urgent)
+                self._pending.insert(position, (message, True))
+                if not self._playing_urgent:
+                    self._interrupt.set()
+            elif self._make_room(urgent=False):
+                self._pending.append((message, False))
+            self._pending_ready.notify()
 
     def shutdown(self):
         self._stop.set()
-        try:
-            self.queue.put_nowait(None)
-        except Full:
-            logger.debug("Audio queue full during shutdown; waiting for worker")
-            self.queue.put(None)
-        self.worker_thread.join(timeout=2.0)
-        if self._pygame_initialized:
+        self._interrupt.set()
+        with self._pending_ready:
+            self._pending_ready.notify_all()
+        if self.worker_thread is not None:
+            self.worker_thread.join(timeout=2.0)
+        if self._pygame is not None:
             try:
-                import pygame
-
-                try:
-                    pygame.mixer.quit()
-                except Exception:
-                    pass
+                self._pygame.mixer.quit()
             except Exception:
                 pass
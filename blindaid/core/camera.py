@@ -0,0 +1,99 @@
+"""Background camera reader so capture I/O overlaps with frame processing."""
+from __future__ import annotations
+
+import logging
+from threading import Condition, Event, Thread
+from typing import List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_NUM_BUFFERS = 3
+
+
+class FrameGrabber:
+    """Keeps the newest frame of an opened capture, read on a daemon thread.
+
+    Only the latest frame is kept, so a slow consumer never works through a
+    backlog of stale frames. Frames are decoded into three reused buffers:
+    the newest one, the one the consumer last took from read_latest(), and
+    the one being written, so no frame is allocated per read.
+    """
+
+    def __init__(self, capture: cv2.VideoCapture):
+        self.capture = capture
+        self._lock = Condition()  # notified whenever a frame is published or reading fails
+        self._buffers: List[Optional[np.ndarray]] = [None] * _NUM_BUFFERS
+        self._latest_idx: Optional[int] = None
+        self._reading_idx: Optional[int] = None
+        self._seq = 0
+        # Decode only every Nth grabbed frame; the rest are grabbed and dropped
+        self.decode_every = 1
+        self._failed = False
+        self._stop = Event()
+        self._thread = Thread(target=self._worker, daemon=True)
+
+    def start(self) -> FrameGrabber:
+        self._thread.start()
+        return self
+
+    def _worker(self) -> None:
+        grabbed = 0
+        while not self._stop.is_set():
+            with self._lock:
+                idx = next(i for i in range(_NUM_BUFFERS) if i not in (self._latest_idx, self._reading_idx))
+            buffer = self._buffers[idx]
+            ok = self.capture.grab()
+            grabbed += 1
+            if ok and grabbed % max(1, self.decode_every):
+                continue
+            if ok:
+                # retrieve() decodes into buffer when its shape/dtype fit
+                ok, frame = self.capture.retrieve(buffer)
+            with self._lock:
+                if not ok:
+                    logger.debug("Camera read failed, stopping grabber")
+                    self._failed = True
+                    self._lock.notify_all()
+                    break
+                self._buffers[idx] = frame
+                self._latest_idx = idx
+                self._seq += 1
+                self._lock.notify_all()
+
+    @property
+    def failed(self) -> bool:
+        """True once the camera has stopped delivering frames."""
+        return self._failed
+
+    def read_latest(self) -> Tuple[Optional[np.ndarray], int]:
+        """Return the newest frame and its sequence number (0 before the first).
+
+        The frame stays untouched until the next read_latest() call, so the
+        caller must copy anything it keeps for longer.
+        """
+        with self._lock:
+            if self._latest_idx is None:
+                return None, 0
+            self._reading_idx = self._latest_idx
+            return self._buffers[self._latest_idx], self._seq
+
+    def wait_latest(self, last_seq: int, timeout: float = 0.1) -> Tuple[Optional[np.ndarray], int]:
+        """Like read_latest(), but first block until a frame newer than last_seq arrives.
+
+        Returns early (with the same sequence number) on timeout or failure.
+        """
+        with self._lock:
+            self._lock.wait_for(lambda: self._seq != last_seq or self._failed, timeout)
+            if self._latest_idx is None:
+                return None, 0
+            self._reading_idx = self._latest_idx
+            return self._buffers[self._latest_idx], self._seq
+
+    def stop(self) -> bool:
+        """Stop reading; True once the worker has exited and the capture is free to release."""
+        self._stop.set()
+        self._thread.join(timeout=1.0)
+        return not self._thread.is_alive()
@@ -2,22 +2,37 @@
 from __future__ import annotations
 
 import logging
+import threading
 from typing import Any, Optional
 
-import cv2
+import numpy as np
+
+from blindaid.core import config
+from blindaid.core.frame_cache import FrameCache, frame_signature
+from blindaid.core.precision import apply_precision
 
 logger = logging.getLogger(__name__)
 
 
 class VisualAssistant:
-    def __init__(self, device: Optional[str] = None):
+    def __init__(self, device: Optional[str] = None, precision: str = "auto"):
         self.device = device or "cpu"
+        self.precision = precision
+        self._dtype: Optional[Any] = None
+        self._shared_processor = None
         self.processor = None
         self.model = None
         self.vqa_processor = None
         self.vqa_model = None
         self._torch: Optional[Any] = None
         self._env_configured = False
+        self._preprocess: dict[int, tuple] = {}  # id(model) -> (mean, std, (h, w)) on device
+        self._caption_cache = FrameCache(
+            config.CAPTION_CACHE_SIZE, config.CAPTION_CACHE_TTL_SECONDS, config.CAPTION_CACHE_MAX_DISTANCE
+        )
+        # Serialises model loads, so a key press during a preload waits for it
+        # instead of loading the same weights a second time
+        self._load_lock = threading.Lock()
 
     def _configure_transformers(self) -> None:
         if self._env_configured:
@@ -44,58 +59,143 @@ class VisualAssistant:
         if self.device == "cpu" and self._torch.cuda.is_available():
             self.device = "cuda"
 
+    def _ensure_processor(self) -> Any:
+        # Both checkpoints ship the same BERT tokenizer and CLIP image
+        # normalisation, so one processor serves both models
+        if self._shared_processor is None:
+            from transformers import BlipProcessor
+
+            self._shared_processor = BlipProcessor.from_pretrained("Salesforce/blip-image-captioning-base")
+        return self._shared_processor
+
     def _ensure_caption_model(self) -> None:
-        if self.processor is not None and self.model is not None:
+        if self.model is not None:
             return
+        with self._load_lock:
+            if self.model is None:
+                self._load_caption_model()
+
+    def _load_caption_model(self) -> None:
         self._ensure_torch()
         self._configure_transformers()
         self._select_device()
 
         logger.info("Loading BLIP caption model on %s", self.device)
-        from transformers import BlipForConditionalGeneration, BlipProcessor
+        from transformers import BlipForConditionalGeneration
 
-        self.processor = BlipProcessor.from_pretrained("Salesforce/blip-image-captioning-base")
+        self.processor = self._ensure_processor()
         # low_cpu_mem_usage was causing issues on my laptop
-        self.model = BlipForConditionalGeneration.from_pretrained(
+        model = BlipForConditionalGeneration.from_pretrained(
             "Salesforce/blip-image-captioning-base", 
             low_cpu_mem_usage=False
         ).to(self.device)
-        self.model.eval()
+        model.eval()
+        # BLIP generate on CPU is bound by Linear weight traffic, so "auto" quantizes there
+        model, self._dtype = apply_precision(
+            model, self._torch, self.device, self.precision, auto_int8_on_cpu=True
+        )
+        if config.CAPTION_TORCH_COMPILE:
+            self._compile_caption_model(model)
+        # Published last: other threads treat a non-None model as ready
+        self.model = model
+
+    def _compile_caption_model(self, model) -> None:
+        """Compile the vision encoder and text decoder in place, then warm them up.
+
+        generate() runs module forwards, so those are compiled rather than the
+        model wrapper. The warm-up pays the compile cost during the load.
+        """
+        torch = self._torch
+        assert torch is not None
+        if self.device != "cuda" or not hasattr(torch, "compile"):
+            logger.info("torch.compile needs CUDA and torch 2.x, skipping")
+            return
+        logger.info("Compiling BLIP caption model")
+        # Fixed 384x384 input, so CUDA graphs can be replayed
+        model.vision_model.forward = torch.compile(model.vision_model.forward, mode="reduce-overhead")
+        # The sequence grows every token; dynamic shapes avoid a recompile per length
+        model.text_decoder.forward = torch.compile(model.text_decoder.forward, dynamic=True)
+        image_size = model.config.vision_config.image_size
+        warmup = torch.zeros((1, 3, image_size, image_size), device=self.device, dtype=self._dtype)
+        with torch.inference_mode():
+            model.generate(pixel_values=warmup, max_length=60)
 
     def _ensure_vqa_model(self) -> None:
-        if self.vqa_processor is not None and self.vqa_model is not None:
+        if self.vqa_model is not None:
             return
+        with self._load_lock:
+            if self.vqa_model is None:
+                self._load_vqa_model()
+
+    def _load_vqa_model(self) -> None:
         self._ensure_torch()
         self._configure_transformers()
         self._select_device()
 
         logger.info("Loading BLIP VQA model on %s", self.device)
-        from transformers import BlipForQuestionAnswering, BlipProcessor
+        from transformers import BlipForQuestionAnswering
 
-        self.vqa_processor = BlipProcessor.from_pretrained("Salesforce/blip-vqa-base")
+        self.vqa_processor = self._ensure_processor()
         # same fix as above
-        self.vqa_model = BlipForQuestionAnswering.from_pretrained(
+        vqa_model = BlipForQuestionAnswering.from_pretrained(
             "Salesforce/blip-vqa-base", 
             low_cpu_mem_usage=False
         ).to(self.device)
-        self.vqa_model.eval()
+        vqa_model.eval()
+        self.vqa_model, self._dtype = apply_precision(
+            vqa_model, self._torch, self.device, self.precision, auto_int8_on_cpu=True
+        )
+
+    def _pixel_values(self, frame, model) -> Any:
+        """BLIP pixel_values for a BGR uint8 frame, computed on the model device.
+
+        Same steps as the processor (RGB, resize, rescale, normalise), but the
+        raw frame is uploaded once and the work happens in torch. The size
+        comes from the model, since the processor is shared between both.
+        """
+        torch = self._torch
+        assert torch is not None and self._shared_processor is not None
+        params = self._preprocess.get(id(model))
+        if params is None:
+            image_processor = self._shared_processor.image_processor
+            mean = torch.tensor(image_processor.image_mean, device=self.device).view(1, 3, 1, 1)
+            std = torch.tensor(image_processor.image_std, device=self.device).view(1, 3, 1, 1)
+            image_size = model.config.vision_config.image_size
+            params = self._preprocess[id(model)] = (mean, std, (image_size, image_size))
+        mean, std, size = params
+
+        image = torch.from_numpy(np.ascontiguousarray(frame)).to(self.device, non_blocking=True)
+        image = image.permute(2, 0, 1).flip(0).unsqueeze(0).float()  # HWC BGR -> NCHW RGB
+        # antialias matches the processor's PIL resize when the camera frame is larger
+        image = torch.nn.functional.interpolate(
+            image, size=size, mode="bicubic", align_corners=False, antialias=True
+        )
+        image = image.clamp_(0, 255).div_(255).sub_(mean).div_(std)
+        return image.to(self._dtype)
 
     def generate_caption(self, frame) -> str:
+        signature = frame_signature(frame, config.CAPTION_SIGNATURE_SIZE)
+        cached = self._caption_cache.get(signature)
+        if cached is not None:
+            return cached
+
         self._ensure_caption_model()
         assert self.processor is not None and self.model is not None and self._torch is not None
 
-        image = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        inputs = self.processor(images=image, return_tensors="pt").to(self.device)
-        with self._torch.no_grad():
-            output = self.model.generate(**inputs, max_length=60)
-        return self.processor.decode(output[0], skip_special_tokens=True).strip()
+        with self._torch.inference_mode():
+            pixel_values = self._pixel_values(frame, self.model)
+            output = self.model.generate(pixel_values=pixel_values, max_length=60)
+        caption = self.processor.decode(output[0], skip_special_tokens=True).strip()
+        if caption:
+            self._caption_cache.put(signature, caption)
+        return caption
 
     def answer_question(self, frame, question: str) -> str:
         self._ensure_vqa_model()
         assert self.vqa_processor is not None and self.vqa_model is not None and self._torch is not None
 
-        image = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        inputs = self.vqa_processor(images=image, text=question, return_tensors="pt").to(self.device)
-        with self._torch.no_grad():
+        inputs = self.vqa_processor(text=question, return_tensors="pt").to(self.device)
+        with self._torch.inference_mode():
+            inputs["pixel_values"] = self._pixel_values(frame, self.vqa_model)
             output = self.vqa_model.generate(**inputs)
         return self.vqa_processor.decode(output[0], skip_special_tokens=True).strip()
\ No newline at end of file
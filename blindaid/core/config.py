@@ -8,8 +8,19 @@ RESOURCES_DIR = PROJECT_ROOT / "resources"
 MODELS_DIR = RESOURCES_DIR / "models"
 KNOWN_FACES_DIR = RESOURCES_DIR / "known_faces"
 
+# Modes selectable at startup (keys of ModeController's mode table)
+MODE_KEYS = ("sitting", "guardian", "reading", "people")
+
 # Camera settings
 DEFAULT_CAMERA_INDEX = 0
+# Frames the capture backend may queue; 1 keeps what we read fresh (0 = backend default)
+CAPTURE_BUFFER_SIZE = 1
+# In sitting mode only every Nth camera frame is decoded and shown
+IDLE_DECODE_STRIDE = 2
+
+# Model precision: "auto" (fp16 on CUDA, fp32 on CPU), "fp32", "fp16" or "int8"
+MODEL_PRECISION = "auto"
+PRECISION_CHOICES = ("auto", "fp32", "fp16", "int8")
 
 # Object Detection settings
 OBJECT_DETECTION_MODEL = MODELS_DIR / "object_blind_aide.onnx"
@@ -32,6 +43,30 @@ FACE_FRAME_SCALE = 0.25
 FACE_PROCESS_EVERY_N_FRAMES = 2
 FACE_DEBOUNCE_SECONDS = 15.0
 FACE_OVERLAY_TIMEOUT = 0.6
+# Known-face encodings keyed by image hash, so startup skips re-encoding
+FACE_ENCODINGS_CACHE = KNOWN_FACES_DIR / ".encodings_cache.npz"
+# Match against one mean encoding per person instead of one per photo. Off by
+# default: mean encodings shift the distance distribution, and FACE_THRESHOLD
+# is tuned for per-photo matching
+FACE_USE_CENTROIDS = False
+
+# Reuse OCR/face results while consecutive frames hash the same
+FRAME_CACHE_SIZE = 16
+FRAME_CACHE_TTL_SECONDS = 2.0
+# Captions are reused for frames whose signature differs in at most this many bits.
+# The signature is a finer 16x16 (256-bit) dHash: pages or objects with a similar
+# layout can differ in only a few bits of the coarse 8x8 one
+CAPTION_CACHE_SIZE = 32
+CAPTION_CACHE_TTL_SECONDS = 10.0
+CAPTION_SIGNATURE_SIZE = 16
+CAPTION_CACHE_MAX_DISTANCE = 2
+# Depth maps are reused for near-identical frames; kept short-lived since
+# they drive obstacle warnings
+DEPTH_CACHE_SIZE = 32
+DEPTH_CACHE_TTL_SECONDS = 1.0
+DEPTH_CACHE_MAX_DISTANCE = 4
+# Compile the BLIP caption model with torch.compile on CUDA (slow first load)
+CAPTION_TORCH_COMPILE = False
 
 # Scene mode defaults
 SCENE_OBJECT_COOLDOWN_SECONDS = 4.0
@@ -41,15 +76,50 @@ SCENE_HINT_TEXT = "0:Sit 1:Walk 2:Read 3:Ppl 4:Ask 5:Cap Q:Quit"
 AUDIO_ENABLED = True
 TTS_RATE = 150
 TTS_VOLUME = 0.9
-# Always use online TTS (gTTS + pygame) for reliability
+# Always use online TTS (gTTS + pygame) for reliability; False speaks offline
+# through pyttsx3 (no per-message network round trip, but flaky on Windows)
 TTS_FORCE_ONLINE = True
+# Mode announcements repeated within this many seconds are not spoken again
+# (guardian warnings are paced by its own cooldown instead)
+SPEECH_DEDUP_WINDOW = 4.0
+# Wait for the "Listening..." prompt before opening the mic (for setups
+# where the speaker bleeds into the microphone)
+TTS_MIC_HALF_DUPLEX = False
+# gTTS clips of fixed phrases, rendered once by `python -m blindaid --prerender-tts`
+TTS_CLIPS_DIR = RESOURCES_DIR / "audio_clips"
+TTS_PRERENDER_PHRASES = (
+    "BlindAid Online. Ready.",
+    "Audio check one two three.",
+    "Listening...",
+    "I didn't hear a question.",
+    "I couldn't find an answer.",
+    "Sorry, I encountered an error.",
+    "Stop! Obstacle Ahead.",
+    "Obstacle on Left.",
+    "Obstacle on Right.",
+)
+# Every other synthesised clip is kept on disk too, least recently played
+# evicted past the size limit, and anything unplayed for the max age dropped
+TTS_DISK_CACHE_DIR = RESOURCES_DIR / "tts_cache"
+TTS_DISK_CACHE_MAX_BYTES = 100 * 1024 * 1024
+TTS_DISK_CACHE_MAX_AGE_DAYS = 30
 
 # Display settings
 DISPLAY_FPS = True
+# Upper bound on HUD redraws per second; faster cameras still feed inference (0 = no cap)
+DISPLAY_MAX_FPS = 30.0
+# Wider frames are shrunk before the HUD is drawn and shown (0 = never)
+DISPLAY_MAX_WIDTH = 640
 BOUNDING_BOX_COLOR_KNOWN = (0, 255, 0)  # Green
 BOUNDING_BOX_COLOR_UNKNOWN = (0, 0, 255)  # Red
 BOUNDING_BOX_THICKNESS = 2
 
+# Background model preload starts once the UI holds this FPS (or after the max wait)
+PRELOAD_MIN_FPS = 10.0
+PRELOAD_MAX_WAIT_SECONDS = 10.0
+# Nice increment for the preload threads (Linux only)
+PRELOAD_NICE = 10
+
 # Performance
 FRAME_WIDTH = 320
 FRAME_HEIGHT = 240
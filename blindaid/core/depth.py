@@ -7,15 +7,30 @@ from typing import Any
 import cv2
 import numpy as np
 
+from blindaid.core import config
+from blindaid.core.frame_cache import FrameCache, frame_signature
+from blindaid.core.precision import apply_precision
+
 logger = logging.getLogger(__name__)
 
 
 class DepthAnalyzer:
-    def __init__(self, device: str | None = None):
+    def __init__(self, device: str | None = None, precision: str = "auto"):
         self.device = device or "cpu"
+        self.precision = precision
+        self._dtype: Any | None = None
         self.processor = None
         self.model = None
+        # Input geometry and per-channel affine taken from the processor at load
+        self._input_size: tuple[int, int] | None = None  # (width, height)
+        self._scale: np.ndarray | None = None
+        self._offset: np.ndarray | None = None
+        self._input: np.ndarray | None = None  # reused (1, 3, H, W) float32 batch
+        self._depth_cache = FrameCache(
+            config.DEPTH_CACHE_SIZE, config.DEPTH_CACHE_TTL_SECONDS, config.DEPTH_CACHE_MAX_DISTANCE
+        )
         self._torch: Any | None = None
+        self._memory_format: Any | None = None
         self._env_ready = False
 
     def _prepare_env(self) -> None:
@@ -47,23 +62,72 @@ class DepthAnalyzer:
         processor = DPTImageProcessor.from_pretrained("Intel/dpt-hybrid-midas")
         model = DPTForDepthEstimation.from_pretrained("Intel/dpt-hybrid-midas").to(self.device)
         model.eval()
+        model, self._dtype = apply_precision(model, torch, self.device, self.precision)
+        if self.device == "cuda":
+            # The hybrid backbone's convolutions run faster NHWC on tensor cores
+            self._memory_format = torch.channels_last
+            model = model.to(memory_format=self._memory_format)
+
+        if not getattr(processor, "keep_aspect_ratio", False):
+            height, width = processor.size["height"], processor.size["width"]
+            std = np.asarray(processor.image_std, dtype=np.float32).reshape(3, 1, 1)
+            mean = np.asarray(processor.image_mean, dtype=np.float32).reshape(3, 1, 1)
+            # (x / 255 - mean) / std == x * scale + offset
+            self._scale = 1.0 / (255.0 * std)
+            self._offset = -mean / std
+            self._input_size = (width, height)
+            self._input = np.empty((1, 3, height, width), dtype=np.float32)
 
         self.processor = processor
         self.model = model
         self._torch = torch
 
+    def _pixel_values(self, frame: np.ndarray) -> Any:
+        """DPT pixel_values for a BGR uint8 frame.
+
+        Resizes first so the colour swap and normalisation touch only the
+        small image, then writes them into the reused input batch.
+        """
+        torch = self._torch
+        assert torch is not None
+        if self._input is None:
+            # Aspect-preserving processors pick the size per frame
+            rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            pixel_values = self.processor(images=rgb, return_tensors="pt")["pixel_values"]
+            return self._to_model_input(pixel_values)
+        small = cv2.resize(frame, self._input_size, interpolation=cv2.INTER_AREA)
+        chw = small.transpose(2, 0, 1)[::-1]  # HWC BGR -> CHW RGB view
+        batch = self._input[0]
+        np.multiply(chw, self._scale, out=batch)
+        batch += self._offset
+        return self._to_model_input(torch.from_numpy(self._input))
+
+    def _to_model_input(self, pixel_values: Any) -> Any:
+        pixel_values = pixel_values.to(self.device, self._dtype)
+        if self._memory_format is not None:
+            pixel_values = pixel_values.contiguous(memory_format=self._memory_format)
+        return pixel_values
+
     def compute_depth(self, frame: np.ndarray) -> np.ndarray:
+        """Normalised depth map (0..1) at the frame's size; treat it as read-only."""
+        signature = frame_signature(frame)
+        cached = self._depth_cache.get(signature)
+        if cached is not None and cached.shape == frame.shape[:2]:
+            return cached
+
         self._ensure_loaded()
         assert self.processor is not None and self.model is not None and self._torch is not None
 
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        inputs = self.processor(images=rgb, return_tensors="pt").to(self.device)
-        with self._torch.no_grad():
-            outputs = self.model(**inputs)
-            pred = outputs.predicted_depth
-        depth = pred.squeeze().cpu().numpy()
-        depth = cv2.resize(depth, (frame.shape[1], frame.shape[0]))
-        depth = depth - depth.min()
-        if depth.max() > 0:
-            depth = depth / depth.max()
+        torch = self._torch
+        with torch.inference_mode():
+            outputs = self.model(pixel_values=self._pixel_values(frame))
+            # Resize and normalise on the model device; only the finished map is copied back
+            pred = outputs.predicted_depth.unsqueeze(1).float()
+            pred = torch.nn.functional.interpolate(
+                pred, size=frame.shape[:2], mode="bilinear", align_corners=False
+            )
+            pred = pred.sub_(pred.amin())
+            pred = pred.div_(pred.amax().clamp_min(1e-6))
+            depth = pred[0, 0].cpu().numpy()
+        self._depth_cache.put(signature, depth)
         return depth
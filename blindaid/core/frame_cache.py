@@ -0,0 +1,66 @@
+"""Per-frame result cache keyed by a perceptual hash.
+
+A still camera produces near-identical frames, so OCR/face results can be
+reused instead of re-running the model on every one of them.
+"""
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+import cv2
+import numpy as np
+
+
+def frame_signature(frame: np.ndarray, hash_size: int = 8) -> int:
+    """Difference hash (dHash) of a BGR or grayscale frame, hash_size**2 bits."""
+    small = cv2.resize(frame, (hash_size + 1, hash_size), interpolation=cv2.INTER_AREA)
+    if small.ndim == 3:
+        small = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+    bits = small[:, 1:] > small[:, :-1]
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+
+class FrameCache:
+    """Small LRU of results keyed by frame_signature(), with expiry.
+
+    With max_distance > 0, a lookup that misses exactly falls back to the
+    closest stored signature within that many differing bits.
+    """
+
+    def __init__(self, capacity: int = 16, ttl: float = 2.0, max_distance: int = 0):
+        self.capacity = max(1, capacity)
+        self.ttl = ttl
+        self.max_distance = max_distance
+        self._entries: OrderedDict[int, Tuple[float, Any]] = OrderedDict()
+
+    def _nearest(self, key: int) -> Optional[int]:
+        best, best_distance = None, self.max_distance + 1
+        for stored in self._entries:
+            distance = bin(stored ^ key).count("1")
+            if distance < best_distance:
+                best, best_distance = stored, distance
+        return best
+
+    def get(self, key: int) -> Optional[Any]:
+        if key not in self._entries and self.max_distance > 0:
+            key = self._nearest(key)
+        entry = self._entries.get(key) if key is not None else None
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if time.monotonic() - stored_at > self.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: int, value: Any) -> None:
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
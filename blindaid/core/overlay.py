@@ -0,0 +1,137 @@
+"""Cached text rendering for the HUD overlay."""
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+_FONT = cv2.FONT_HERSHEY_SIMPLEX
+
+Color = Tuple[int, int, int]
+# (text, baseline origin, font scale, color), as passed to cv2.putText
+TextItem = Tuple[str, Tuple[int, int], float, Color]
+
+
+class TextSprite(NamedTuple):
+    alpha: np.ndarray  # uint16 glyph coverage, 0..255
+    mask: np.ndarray  # alpha > 0
+    color: np.ndarray  # uint16 BGR
+    ascent: int  # sprite row of the text baseline
+    pad: int  # sprite column of the text origin
+
+
+def _rasterize(text: str, scale: float, color: Color, thickness: int) -> TextSprite:
+    (width, height), baseline = cv2.getTextSize(text, _FONT, scale, thickness)
+    pad = thickness + 1
+    ascent = height + pad
+    canvas = np.zeros((ascent + baseline + pad, width + 2 * pad), dtype=np.uint8)
+    cv2.putText(canvas, text, (pad, ascent), _FONT, scale, 255, thickness)
+    return TextSprite(
+        alpha=canvas.astype(np.uint16),
+        mask=canvas > 0,
+        color=np.array(color, dtype=np.uint16),
+        ascent=ascent,
+        pad=pad,
+    )
+
+
+class TextSpriteCache:
+    """Rasterises each distinct HUD string once and blits it afterwards.
+
+    Most HUD text (mode label, hint line, FPS) repeats for hundreds of
+    frames, so stroking the Hershey glyphs every frame is wasted work.
+    Coverage is kept as alpha so antialiased builds blend like putText.
+    """
+
+    def __init__(self, capacity: int = 128):
+        self.capacity = capacity
+        self._sprites: OrderedDict[tuple, TextSprite] = OrderedDict()
+        self._pinned: dict[tuple, TextSprite] = {}
+
+    def pin(self, text: str, scale: float, color: Color, thickness: int = 1) -> TextSprite:
+        """Render a static string now and keep it out of LRU eviction."""
+        key = (text, scale, color, thickness)
+        sprite = self._pinned.get(key)
+        if sprite is None:
+            sprite = self._sprites.pop(key, None) or _rasterize(text, scale, color, thickness)
+            self._pinned[key] = sprite
+        return sprite
+
+    def get(self, text: str, scale: float, color: Color, thickness: int = 1) -> TextSprite:
+        key = (text, scale, color, thickness)
+        sprite = self._pinned.get(key)
+        if sprite is not None:
+            return sprite
+        sprite = self._sprites.get(key)
+        if sprite is not None:
+            self._sprites.move_to_end(key)
+            return sprite
+
+        sprite = _rasterize(text, scale, color, thickness)
+        self._sprites[key] = sprite
+        if len(self._sprites) > self.capacity:
+            self._sprites.popitem(last=False)
+        return sprite
+
+
+class OverlayLayer:
+    """Composites all HUD text for a frame in a single blend.
+
+    Sprites are written into a persistent premultiplied colour/alpha layer;
+    only the boxes written last time are cleared before the next render, and
+    the layer is reused as-is while the text items stay the same.
+    """
+
+    def __init__(self, sprites: Optional[TextSpriteCache] = None):
+        self.sprites = sprites or TextSpriteCache()
+        self._alpha: Optional[np.ndarray] = None
+        self._premultiplied: Optional[np.ndarray] = None
+        self._dirty: List[Tuple[slice, slice]] = []
+        self._rows = np.empty(0, dtype=np.intp)
+        self._cols = np.empty(0, dtype=np.intp)
+        self._pixel_alpha = np.empty((0, 1), dtype=np.uint16)
+        self._pixel_color = np.empty((0, 3), dtype=np.uint16)
+        self._rendered: Optional[Tuple[Tuple[int, int], Tuple[TextItem, ...]]] = None
+
+    def _render(self, shape: Tuple[int, int], items: Sequence[TextItem]) -> None:
+        if self._alpha is None or self._alpha.shape != shape:
+            self._alpha = np.zeros(shape, dtype=np.uint16)
+            self._premultiplied = np.zeros(shape + (3,), dtype=np.uint16)
+            self._dirty = []
+        assert self._premultiplied is not None
+        for rows, cols in self._dirty:
+            self._alpha[rows, cols] = 0
+            self._premultiplied[rows, cols] = 0
+        self._dirty = []
+
+        height, width = shape
+        for text, (x, y), scale, color in items:
+            sprite = self.sprites.get(text, scale, color)
+            x0, y0 = x - sprite.pad, y - sprite.ascent
+            h, w = sprite.mask.shape
+            fx0, fy0 = max(x0, 0), max(y0, 0)
+            fx1, fy1 = min(x0 + w, width), min(y0 + h, height)
+            if fx0 >= fx1 or fy0 >= fy1:
+                continue
+            mask = sprite.mask[fy0 - y0:fy1 - y0, fx0 - x0:fx1 - x0]
+            alpha = sprite.alpha[fy0 - y0:fy1 - y0, fx0 - x0:fx1 - x0][mask]
+            box = (slice(fy0, fy1), slice(fx0, fx1))
+            self._alpha[box][mask] = alpha
+            self._premultiplied[box][mask] = sprite.color * alpha[:, None]
+            self._dirty.append(box)
+
+        self._rows, self._cols = np.nonzero(self._alpha)
+        self._pixel_alpha = self._alpha[self._rows, self._cols][:, None]
+        self._pixel_color = self._premultiplied[self._rows, self._cols]
+
+    def compose(self, frame: np.ndarray, items: Sequence[TextItem]) -> None:
+        """Blend the given text items onto frame in place."""
+        key = (frame.shape[:2], tuple(items))
+        if key != self._rendered:
+            self._render(*key)
+            self._rendered = key
+        pixels = frame[self._rows, self._cols].astype(np.uint16)
+        blended = (pixels * (255 - self._pixel_alpha) + self._pixel_color + 127) // 255
+        frame[self._rows, self._cols] = blended.astype(np.uint8)
@@ -0,0 +1,27 @@
+"""Inference precision for the torch-backed models."""
+from __future__ import annotations
+
+import logging
+from typing import Any, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def apply_precision(
+    model: Any, torch: Any, device: str, precision: str, auto_int8_on_cpu: bool = False
+) -> Tuple[Any, Any]:
+    """Cast or quantize an eval-mode model; returns (model, input dtype).
+
+    "auto" means fp16 on CUDA and fp32 on CPU, or int8 on CPU when
+    auto_int8_on_cpu is set (for Linear-heavy models such as transformers).
+    fp16 only pays off on CUDA and int8 (dynamic quantization of Linear
+    layers) only runs on CPU, so other combinations fall back to fp32.
+    """
+    if precision in ("auto", "fp16") and device == "cuda":
+        return model.half(), torch.float16
+    if device == "cpu" and (precision == "int8" or (precision == "auto" and auto_int8_on_cpu)):
+        quantized = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        return quantized, torch.float32
+    if precision not in ("auto", "fp32"):
+        logger.info("Precision %s not supported on %s, using fp32", precision, device)
+    return model, torch.float32
@@ -9,8 +9,9 @@ from blindaid.core.depth import DepthAnalyzer
 logger = logging.getLogger(__name__)
 
 class GuardianMode:
-    def __init__(self, audio_enabled: bool = True):
+    def __init__(self, audio_enabled: bool = True, precision: str = "auto"):
         self.audio_enabled = audio_enabled
+        self.precision = precision
         self.depth_analyzer = None
         self.frame_counter = 0
         self.last_warning_time = 0.0
@@ -18,9 +19,12 @@ class GuardianMode:
 
     def _ensure_depth_analyzer(self):
         if self.depth_analyzer is None:
-            self.depth_analyzer = DepthAnalyzer()
+            self.depth_analyzer = DepthAnalyzer(precision=self.precision)
         return self.depth_analyzer
 
+    def _ensure_loaded(self):
+        self._ensure_depth_analyzer()._ensure_loaded()
+
     def get_distance_label(self, depth_val):
         # Depth map 0 (far) to 1 (close) hota hai usually.
         # Yeh rough estimation hai:
@@ -42,15 +46,11 @@ class GuardianMode:
                 depth_map = analyzer.compute_depth(frame)
                 
                 h, w = depth_map.shape
-                # Screen ko 3 parts mein divide kar rahe hain
-                left_part = depth_map[:, :w//3]
-                center_part = depth_map[:, w//3:2*w//3]
-                right_part = depth_map[:, 2*w//3:]
-
-                # Har part ka average depth nikalo
-                l_val = np.mean(left_part)
-                c_val = np.mean(center_part)
-                r_val = np.mean(right_part)
+                # Screen ko 3 parts mein divide kar rahe hain; har part ka average
+                # depth = uske columns ke averages ka average (map ek hi baar padha)
+                bounds = [0, w//3, 2*w//3]
+                column_means = depth_map.mean(axis=0)
+                l_val, c_val, r_val = np.add.reduceat(column_means, bounds) / np.diff(bounds + [w])
 
                 # Logic: Kahan sabse zyada khatra hai?
                 msg = ""
@@ -62,7 +62,7 @@ class GuardianMode:
                     msg = "Obstacle on Right."
                 
                 # Agar koi warning hai aur cooldown khatam ho gaya hai
-                now = time.time()
+                now = time.monotonic()
                 if msg and (now - self.last_warning_time > self.warning_cooldown):
                     speech_messages.append(msg)
                     self.last_warning_time = now
@@ -80,7 +80,7 @@ class GuardianMode:
                            cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
 
             except Exception as e:
-                logger.error(f"Depth error: {e}")
+                logger.error("Depth error: %s", e)
 
         return display_frame, info_lines, speech_messages
 
@@ -11,6 +11,7 @@ import cv2
 import numpy as np
 
 from blindaid.core import config
+from blindaid.core.frame_cache import FrameCache, frame_signature
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +31,7 @@ class ReadingMode:
         self.last_text = ""
         self.stable_text_count = 0
         self.last_text_data: List[Tuple[str, float, np.ndarray]] = []
+        self._result_cache = FrameCache(config.FRAME_CACHE_SIZE, config.FRAME_CACHE_TTL_SECONDS)
 
     def _ensure_ocr(self):
         if self.ocr is not None or self._ocr_failed:
@@ -57,7 +59,13 @@ class ReadingMode:
         engine = self._ensure_ocr()
         if engine is None:
             return None
-        return engine.ocr(frame)
+        key = frame_signature(frame)
+        result = self._result_cache.get(key)
+        if result is None:
+            result = engine.ocr(frame)
+            if result is not None:
+                self._result_cache.put(key, result)
+        return result
 
     def _parse_result(self, result) -> List[Tuple[str, float, np.ndarray]]:
         parsed: List[Tuple[str, float, np.ndarray]] = []
@@ -118,7 +126,7 @@ class ReadingMode:
             info_text = " ".join(texts)
             if info_text:
                 info_lines.append(info_text)
-                now = time.time()
+                now = time.monotonic()
                 high_conf = [text for text, score, _ in self.last_text_data if score >= self.confidence_threshold]
                 if info_text == self.last_text:
                     self.stable_text_count += 1
@@ -148,6 +156,7 @@ class ReadingMode:
         self.last_text = ""
         self.last_text_data = []
         self.stable_text_count = 0
+        self._result_cache.clear()
 
     def on_exit(self):
         return
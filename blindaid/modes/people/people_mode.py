@@ -1,34 +1,50 @@
 """Face recognition mode."""
 from __future__ import annotations
 
+import hashlib
+import io
 import logging
 import time
 from pathlib import Path
-from typing import List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
 
 import cv2
-import face_recognition
 import numpy as np
-from ultralytics import YOLO
 
 from blindaid.core import config
+from blindaid.core.frame_cache import FrameCache, frame_signature
+
+if TYPE_CHECKING:
+    from ultralytics import YOLO
 
 logger = logging.getLogger(__name__)
 
+# Cached encodings are only valid for the encoder that produced them
+_ENCODER_TAG = "face_recognition/small/1"
+# Cached in place of an encoding for images with no detectable face
+_NO_FACE = np.empty(0)
+
 
 class PeopleMode:
-    def __init__(self, audio_enabled: bool = True):
+    def __init__(self, audio_enabled: bool = True, precision: str = "auto"):
         self.audio_enabled = audio_enabled
+        # YOLO ignores half precision on CPU, so "auto" can always ask for it
+        self.half = precision in ("auto", "fp16")
         self.start_time = 0.0
         self.duration = 5.0
         self.finished = False
 
         self.face_detector: Optional[YOLO] = None
+        self._face_recognition: Any = None  # module, imported by _ensure_loaded()
         self.known_face_encodings: List[np.ndarray] = []
         self.known_face_names: List[str] = []
+        # known_face_encodings as one float32 matrix, plus each row's squared norm
+        self._encoding_matrix: Optional[np.ndarray] = None
+        self._encoding_sq_norms: Optional[np.ndarray] = None
         self._loaded = False
 
         self.detected_people: Set[str] = set()
+        self._result_cache = FrameCache(config.FRAME_CACHE_SIZE, config.FRAME_CACHE_TTL_SECONDS)
 
     def _ensure_loaded(self) -> None:
         if self._loaded:
@@ -38,6 +54,11 @@ class PeopleMode:
         warnings.filterwarnings("ignore", category=UserWarning)
         warnings.filterwarnings("ignore", category=FutureWarning)
         try:
+            # Both pull in heavy native stacks (torch, dlib), so import on first use
+            import face_recognition
+            from ultralytics import YOLO
+
+            self._face_recognition = face_recognition
             self.face_detector = YOLO(str(config.FACE_RECOGNITION_MODEL), verbose=False)
             self._load_known_faces(config.KNOWN_FACES_DIR)
             self._loaded = True
@@ -51,26 +72,105 @@ class PeopleMode:
             logger.warning("Known faces directory %s not found", path)
             return
 
+        cached, cached_digests = self._read_encoding_cache()
+        encodings_by_hash: Dict[str, np.ndarray] = {}
+        digests_by_stat: Dict[str, str] = {}
         for person_dir in path.iterdir():
             if not person_dir.is_dir():
                 continue
             name = person_dir.name
             for image_path in person_dir.glob("*.*"):
                 try:
-                    image = face_recognition.load_image_file(str(image_path))
-                    encodings = face_recognition.face_encodings(image)
-                    if encodings:
-                        self.known_face_encodings.append(encodings[0])
-                        self.known_face_names.append(name)
+                    # Unchanged files (same path, mtime and size) are not re-read or re-hashed
+                    stat = image_path.stat()
+                    stat_key = f"{image_path.relative_to(path).as_posix()}:{stat.st_mtime_ns}:{stat.st_size}"
+                    digest = cached_digests.get(stat_key)
+                    encoding = cached.get(digest) if digest is not None else None
+                    if encoding is None:
+                        data = image_path.read_bytes()
+                        digest = hashlib.sha1(data).hexdigest()
+                        encoding = cached.get(digest)
+                    if encoding is None:
+                        image = self._face_recognition.load_image_file(io.BytesIO(data))
+                        encodings = self._face_recognition.face_encodings(image)
+                        encoding = encodings[0] if encodings else _NO_FACE
+                    encodings_by_hash[digest] = encoding
+                    digests_by_stat[stat_key] = digest
+                    if encoding.size == 0:
+                        continue
+                    self.known_face_encodings.append(encoding)
+                    self.known_face_names.append(name)
                 except Exception:  # noqa: BLE001
                     continue
 
+        if encodings_by_hash.keys() != cached.keys() or digests_by_stat != cached_digests:
+            self._write_encoding_cache(encodings_by_hash, digests_by_stat)
+        if config.FACE_USE_CENTROIDS:
+            self._reduce_to_centroids()
+        if self.known_face_encodings:
+            self._encoding_matrix = np.asarray(self.known_face_encodings, dtype=np.float32)
+            self._encoding_sq_norms = np.einsum("ij,ij->i", self._encoding_matrix, self._encoding_matrix)
+
+    def _reduce_to_centroids(self) -> None:
+        """Replace the per-photo gallery with each person's mean encoding."""
+        grouped: Dict[str, List[np.ndarray]] = {}
+        for name, encoding in zip(self.known_face_names, self.known_face_encodings):
+            grouped.setdefault(name, []).append(encoding)
+        self.known_face_names = list(grouped)
+        self.known_face_encodings = [np.mean(encodings, axis=0) for encodings in grouped.values()]
+
+    def _read_encoding_cache(self) -> Tuple[Dict[str, np.ndarray], Dict[str, str]]:
+        """Cached encodings by image hash, and image hashes by "path:mtime:size"."""
+        cache_path = Path(config.FACE_ENCODINGS_CACHE)
+        if not cache_path.is_file():
+            return {}, {}
+        try:
+            with np.load(cache_path, allow_pickle=False) as data:
+                if str(data["encoder"]) != _ENCODER_TAG:
+                    return {}, {}
+                encodings = dict(zip(data["hashes"].tolist(), data["encodings"]))
+                if "no_face_hashes" in data.files:
+                    encodings.update((digest, _NO_FACE) for digest in data["no_face_hashes"].tolist())
+                digests: Dict[str, str] = {}
+                if "stat_keys" in data.files:
+                    digests = dict(zip(data["stat_keys"].tolist(), data["stat_hashes"].tolist()))
+                return encodings, digests
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Ignoring unreadable face encoding cache %s: %s", cache_path, exc)
+            return {}, {}
+
+    def _write_encoding_cache(
+        self, encodings_by_hash: Dict[str, np.ndarray], digests_by_stat: Dict[str, str]
+    ) -> None:
+        cache_path = Path(config.FACE_ENCODINGS_CACHE)
+        hashes = [digest for digest, encoding in encodings_by_hash.items() if encoding.size]
+        no_face_hashes = [digest for digest, encoding in encodings_by_hash.items() if not encoding.size]
+        encodings = (
+            np.stack([encodings_by_hash[digest] for digest in hashes])
+            if hashes
+            else np.empty((0, 128))
+        )
+        try:
+            np.savez_compressed(
+                cache_path,
+                encoder=np.array(_ENCODER_TAG),
+                hashes=np.array(hashes, dtype=str),
+                encodings=encodings,
+                no_face_hashes=np.array(no_face_hashes, dtype=str),
+                stat_keys=np.array(list(digests_by_stat), dtype=str),
+                stat_hashes=np.array(list(digests_by_stat.values()), dtype=str),
+            )
+        except OSError as exc:
+            logger.warning("Could not write face encoding cache %s: %s", cache_path, exc)
+
     def _recognize_face(self, encoding: np.ndarray) -> Tuple[str, float]:
-        if not self.known_face_encodings:
+        if self._encoding_matrix is None or self._encoding_sq_norms is None:
             return "Unknown", 0.0
-        distances = face_recognition.face_distance(self.known_face_encodings, encoding)
-        best_idx = int(np.argmin(distances))
-        best_distance = float(distances[best_idx])
+        # |k - q|^2 = |k|^2 - 2 k.q + |q|^2, one matrix-vector product for all known faces
+        query = encoding.astype(np.float32)
+        sq_distances = self._encoding_sq_norms - 2.0 * (self._encoding_matrix @ query) + query @ query
+        best_idx = int(np.argmin(sq_distances))
+        best_distance = float(np.sqrt(max(float(sq_distances[best_idx]), 0.0)))
         confidence = max(0.0, 1.0 - best_distance)
         if best_distance <= config.FACE_THRESHOLD:
             return self.known_face_names[best_idx], confidence
@@ -81,6 +181,7 @@ class PeopleMode:
         self.start_time = time.monotonic()
         self.finished = False
         self.detected_people = set()
+        self._result_cache.clear()
         logger.info("People mode started")
 
     def on_exit(self) -> None:
@@ -107,6 +208,27 @@ class PeopleMode:
             speech.append("No one recognized.")
         return info_lines, speech
 
+    def _detect_faces(self, frame: np.ndarray) -> List[Tuple[Tuple[int, int, int, int], str]]:
+        """Locate and name every face as ((top, right, bottom, left), name)."""
+        h, w = frame.shape[:2]
+        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        results = self.face_detector(rgb_frame, verbose=False, half=self.half)
+        if not results:
+            return []
+
+        boxes = results[0].boxes.xyxy.cpu().numpy().astype(int)
+        face_locations = []
+        for (x1, y1, x2, y2) in boxes:
+            x1, y1 = max(x1, 0), max(y1, 0)
+            x2, y2 = min(x2, w - 1), min(y2, h - 1)
+            face_locations.append((y1, x2, y2, x1))
+
+        encodings = self._face_recognition.face_encodings(rgb_frame, face_locations)
+        return [
+            (location, self._recognize_face(encoding)[0])
+            for location, encoding in zip(face_locations, encodings)
+        ]
+
     def process_frame(self, frame: np.ndarray) -> Tuple[np.ndarray, List[str], List[str]]:
         display_frame = frame.copy()
         if self.finished:
@@ -123,22 +245,13 @@ class PeopleMode:
         if self.face_detector is None:
             return display_frame, info_lines, speech_messages
 
-        h, w = frame.shape[:2]
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = self.face_detector(rgb_frame, verbose=False)
-        if not results:
-            return display_frame, info_lines, speech_messages
-
-        boxes = results[0].boxes.xyxy.cpu().numpy().astype(int)
-        face_locations = []
-        for (x1, y1, x2, y2) in boxes:
-            x1, y1 = max(x1, 0), max(y1, 0)
-            x2, y2 = min(x2, w - 1), min(y2, h - 1)
-            face_locations.append((y1, x2, y2, x1))
+        key = frame_signature(frame)
+        faces = self._result_cache.get(key)
+        if faces is None:
+            faces = self._detect_faces(frame)
+            self._result_cache.put(key, faces)
 
-        encodings = face_recognition.face_encodings(rgb_frame, face_locations)
-        for (top, right, bottom, left), encoding in zip(face_locations, encodings):
-            name, _ = self._recognize_face(encoding)
+        for (top, right, bottom, left), name in faces:
             self.detected_people.add(name)
 
             color = (0, 255, 0) if name != "Unknown" else (0, 0, 255)
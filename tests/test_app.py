@@ -0,0 +1,56 @@
+import unittest
+
+from blindaid.app import _build_parser, _fast_parse
+
+# (option, value) pairs for the flags _fast_parse understands
+_VALUED = [
+    ("--start-mode", "reading"),
+    ("--start-mode", "people"),
+    ("--camera", "1"),
+    ("--camera", "-1"),
+    ("--precision", "fp16"),
+    ("--precision", "int8"),
+]
+_SWITCHES = [[], ["--no-audio"], ["--debug"], ["--no-audio", "--debug"]]
+
+
+def _forms(option, value):
+    return [[option, value], [f"{option}={value}"]]
+
+
+class FastParseParityTest(unittest.TestCase):
+    def assert_parity(self, argv):
+        fast = _fast_parse(argv)
+        self.assertIsNotNone(fast, argv)
+        self.assertEqual(vars(fast), vars(_build_parser().parse_args(argv)), argv)
+
+    def test_supported_flags_match_argparse(self):
+        self.assert_parity([])
+        for switches in _SWITCHES:
+            self.assert_parity(switches)
+            for option, value in _VALUED:
+                for form in _forms(option, value):
+                    self.assert_parity(form + switches)
+                    self.assert_parity(switches + form)
+
+    def test_combined_flags_match_argparse(self):
+        for camera in _forms("--camera", "2"):
+            for mode in _forms("--start-mode", "guardian"):
+                for precision in _forms("--precision", "fp32"):
+                    self.assert_parity(camera + mode + precision + ["--debug"])
+
+    def test_empty_or_padded_values_fall_back_to_argparse(self):
+        for argv in (
+            ["--camera= 1"],
+            ["--camera=1 "],
+            ["--camera="],
+            ["--camera", " 1"],
+            ["--camera", ""],
+            ["--start-mode= reading"],
+            ["--precision", "fp16 "],
+        ):
+            self.assertIsNone(_fast_parse(argv), argv)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+
+from blindaid.core.audio import AudioPlayer
+
+
+class QueueOverflowTest(unittest.TestCase):
+    def setUp(self):
+        self.player = AudioPlayer(use_online=True)
+        # Queue directly without a worker draining it
+        self.player.worker_thread = object()
+
+    def _queued(self):
+        return list(self.player._pending)
+
+    def test_full_queue_of_warnings_keeps_them_all(self):
+        warnings = [f"Obstacle {i}." for i in range(self.player._pending.maxlen)]
+        for warning in warnings:
+            self.player.speak(warning, urgent=True)
+
+        self.player.speak("Hello.")
+
+        self.assertEqual(self._queued(), [(warning, True) for warning in warnings])
+
+    def test_full_queue_drops_oldest_non_urgent(self):
+        maxlen = self.player._pending.maxlen
+        self.player.speak("Stop! Obstacle Ahead.", urgent=True)
+        for i in range(maxlen - 1):
+            self.player.speak(f"Message {i}.")
+
+        self.player.speak("Newest.")
+
+        queued = self._queued()
+        self.assertEqual(queued[0], ("Stop! Obstacle Ahead.", True))
+        self.assertNotIn(("Message 0.", False), queued)
+        self.assertEqual(queued[-1], ("Newest.", False))
+        self.assertEqual(len(queued), maxlen)
+
+    def test_urgent_message_displaces_non_urgent_not_warnings(self):
+        maxlen = self.player._pending.maxlen
+        self.player.speak("Obstacle on Left.", urgent=True)
+        for i in range(maxlen - 1):
+            self.player.speak(f"Message {i}.")
+
+        self.player.speak("Obstacle on Right.", urgent=True)
+
+        queued = self._queued()
+        self.assertEqual(queued[:2], [("Obstacle on Left.", True), ("Obstacle on Right.", True)])
+        self.assertNotIn(("Message 0.", False), queued)
+        self.assertEqual(len(queued), maxlen)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+from types import SimpleNamespace
+
+import cv2
+import numpy as np
+
+from blindaid.core.caption import VisualAssistant
+
+
+def _page(lines):
+    page = np.full((480, 640, 3), 255, dtype=np.uint8)
+    for row, text in enumerate(lines):
+        cv2.putText(page, text, (40, 80 + row * 60), cv2.FONT_HERSHEY_SIMPLEX, 1.2, (0, 0, 0), 2)
+    return page
+
+
+class _NoGrad:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class CaptionCacheTest(unittest.TestCase):
+    def setUp(self):
+        # Stand-in model: the "caption" is the index of the frame it was shown
+        self.frames = []
+        assistant = VisualAssistant()
+        assistant.model = SimpleNamespace(generate=self._generate)
+        assistant.processor = SimpleNamespace(decode=lambda output, skip_special_tokens: output)
+        assistant._torch = SimpleNamespace(inference_mode=_NoGrad)
+        assistant._pixel_values = lambda frame, model: frame
+        self.assistant = assistant
+
+    def _generate(self, pixel_values, max_length):
+        self.frames.append(pixel_values)
+        return [f"scene {len(self.frames)}"]
+
+    def test_similar_layout_different_scene_is_captioned_again(self):
+        label = _page(["Take two tablets", "with water after", "meals twice daily", "do not exceed four"])
+        # Same four-line layout; the coarse 8x8 dHash of the two differs in only 3 bits
+        sign = _page(["Platform four for", "the express train", "to the city center", "departs at noon"])
+
+        first = self.assistant.generate_caption(label)
+        second = self.assistant.generate_caption(sign)
+
+        self.assertNotEqual(first, second)
+        self.assertEqual(len(self.frames), 2)
+
+    def test_same_scene_reuses_caption(self):
+        label = _page(["Take two tablets", "with water after", "meals twice daily", "do not exceed four"])
+
+        first = self.assistant.generate_caption(label)
+        second = self.assistant.generate_caption(label.copy())
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(self.frames), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+from unittest import mock
+
+from blindaid.controller import ModeController
+
+
+class _RecordingPlayer:
+    def __init__(self):
+        self.spoken = []
+
+    def speak(self, message, urgent=False):
+        self.spoken.append((message, urgent))
+
+    def shutdown(self):
+        pass
+
+
+class SpeechTest(unittest.TestCase):
+    def setUp(self):
+        self.controller = ModeController(audio_enabled=False)
+        self.player = self.controller.audio_player = _RecordingPlayer()
+        self.addCleanup(self._shutdown)
+
+    def _shutdown(self):
+        # Headless OpenCV builds have no window support
+        with mock.patch("blindaid.controller.cv2.destroyAllWindows"):
+            self.controller.shutdown()
+
+    def _speak_at(self, now, messages, **kwargs):
+        with mock.patch("blindaid.controller.time.monotonic", return_value=now):
+            self.controller._speak_messages(messages, dedupe=True, **kwargs)
+
+    def test_guardian_warnings_past_its_cooldown_are_both_spoken(self):
+        self._speak_at(100.0, ["Stop! Obstacle Ahead."], urgent=True)
+        self._speak_at(103.0, ["Stop! Obstacle Ahead."], urgent=True)
+
+        self.assertEqual(self.player.spoken, [("Stop! Obstacle Ahead.", True)] * 2)
+
+    def test_repeated_ordinary_speech_is_deduped(self):
+        self._speak_at(100.0, ["No text detected."])
+        self._speak_at(103.0, ["No text detected."])
+
+        self.assertEqual(self.player.spoken, [("No text detected.", False)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+import numpy as np
+
+from blindaid.core import config
+from blindaid.modes.people.people_mode import PeopleMode
+
+
+class EncodingCacheTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.faces_dir = Path(tmp.name)
+        (self.faces_dir / "alice").mkdir()
+        (self.faces_dir / "alice" / "face.jpg").write_bytes(b"face")
+        (self.faces_dir / "alice" / "blank.jpg").write_bytes(b"blank")
+        self.encoded = []
+
+        cache_patch = mock.patch.object(config, "FACE_ENCODINGS_CACHE", self.faces_dir / ".cache.npz")
+        cache_patch.start()
+        self.addCleanup(cache_patch.stop)
+
+    def _face_encodings(self, image):
+        self.encoded.append(image)
+        return [np.ones(128)] if image == b"face" else []
+
+    def _load(self):
+        mode = PeopleMode()
+        mode._face_recognition = SimpleNamespace(
+            load_image_file=lambda file: file.read(), face_encodings=self._face_encodings
+        )
+        mode._load_known_faces(self.faces_dir)
+        return mode
+
+    def test_images_without_a_face_are_not_encoded_again(self):
+        first = self._load()
+        self.assertEqual(sorted(self.encoded), [b"blank", b"face"])
+        self.assertEqual(first.known_face_names, ["alice"])
+
+        self.encoded.clear()
+        second = self._load()
+
+        self.assertEqual(self.encoded, [])
+        self.assertEqual(second.known_face_names, ["alice"])
+
+
+if __name__ == "__main__":
+    unittest.main()